@@ -19,13 +19,16 @@ Configuração:
     - API: Open-Meteo (gratuita, sem limites)
 """
 
+import gzip
+import os
+import shutil
 import sys
 import time
 import logging
-from datetime import datetime, date, timedelta
-from typing import Optional
+from logging.handlers import MemoryHandler, TimedRotatingFileHandler
+from datetime import datetime, date, timedelta, time as dt_time
+from typing import Iterable, Optional
 import pandas as pd
-import schedule
 from pathlib import Path
 
 # Adicionar o diretório do projeto ao path
@@ -34,17 +37,51 @@ sys.path.append(str(Path(__file__).parent))
 # Importar serviços
 from python_analytics.app.services.open_meteo_service import OpenMeteoService
 
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    """Comprime o log rotacionado e remove o arquivo original"""
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
 # Configuração de logging
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Rotação semanal (segunda-feira) com backups comprimidos em gzip (~6 meses)
+file_handler = TimedRotatingFileHandler('monitoring.log', when='W0', backupCount=26, encoding='utf-8')
+file_handler.namer = lambda name: name + '.gz'
+file_handler.rotator = _gzip_rotator
+file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+# Agrupa as mensagens de um ciclo em uma única escrita no disco
+buffered_file_handler = MemoryHandler(capacity=100, flushLevel=logging.WARNING, target=file_handler)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler('monitoring.log'),
+        buffered_file_handler,
         logging.StreamHandler()
-    ]
+    ],
+    # O pacote python_analytics.app já chama basicConfig ao ser importado
+    force=True
 )
 logger = logging.getLogger(__name__)
 
+
+def _next_monitoring_datetime(now: datetime, weekdays: Iterable[int], run_time: dt_time) -> datetime:
+    """Calcula o próximo horário de coleta (dia da semana + hora) após `now`"""
+    candidates = []
+    for weekday in weekdays:
+        run_date = now.date() + timedelta(days=(weekday - now.weekday()) % 7)
+        run_at = datetime.combine(run_date, run_time)
+        if run_at <= now:
+            run_at += timedelta(weeks=1)
+        candidates.append(run_at)
+    return min(candidates)
+
+
 class ContinuousClimateMonitor:
     """
     Monitor Climático Contínuo para Montreal (2025-2026)
@@ -52,11 +89,21 @@ class ContinuousClimateMonitor:
     """
 
     MONITORING_DAYS = [0, 2, 4]  # Monday, Wednesday, Friday
+    MONITORING_TIME = dt_time(9, 0)
+    MAX_SLEEP_SECONDS = 3600
     START_YEAR = 2025
     END_YEAR = 2026
 
+    # Colunas agregadas nos relatórios; as de ponto flutuante são convertidas para
+    # float32 numa cópia, o que reduz pela metade a memória percorrida
+    REPORT_COLUMNS = (
+        'temperature_mean', 'temperature_max', 'temperature_min',
+        'humidity_mean', 'wind_speed_mean', 'precipitation'
+    )
+
     def __init__(self):
         self.open_meteo = OpenMeteoService()
+        self._collection_cache = {}
         self._setup_directories()
         logger.info("Continuous Climate Monitor initialized for 2025-2026")
 
@@ -72,36 +119,63 @@ class ContinuousClimateMonitor:
         """Verifica se hoje é dia de monitoramento"""
         return date.today().weekday() in ContinuousClimateMonitor.MONITORING_DAYS
 
-    def collect_weather_data(self) -> Optional[pd.DataFrame]:
-        """Coleta dados climáticos semanais"""
+    def collect_weather_data(self, weeks_back: int = 4) -> Optional[pd.DataFrame]:
+        """Coleta dados climáticos semanais (memoizado durante o ciclo)"""
+        cache_key = (weeks_back, date.today())
+        if cache_key in self._collection_cache:
+            return self._collection_cache[cache_key]
+
         try:
-            data = self.open_meteo.get_weekly_monitoring_data(weeks_back=4)
+            data = self.open_meteo.get_weekly_monitoring_data(weeks_back=weeks_back)
             if data is not None and not data.empty:
                 logger.info(f"Collected {len(data)} monitoring records")
+                self._collection_cache[cache_key] = data
                 return data
         except Exception as e:
             logger.error(f"Error collecting weather data: {e}")
         return None
 
-    def generate_monthly_report(self) -> Optional[str]:
-        """Gera relatório mensal"""
+    def generate_monthly_report(self, data: Optional[pd.DataFrame] = None,
+                                now: Optional[datetime] = None) -> Optional[str]:
+        """Gera relatório mensal (reutiliza os dados já coletados quando fornecidos)"""
         try:
-            data = self.collect_weather_data()
+            if data is None:
+                data = self.collect_weather_data()
             if data is None or data.empty:
                 return None
 
-            report_date = datetime.now().strftime("%Y-%m")
+            now = now or datetime.now()
+            report_date = now.strftime("%Y-%m")
             report_path = self.reports_dir / f"monthly_report_{report_date}.txt"
 
+            # Cópia em float32 só para o relatório; os dados coletados (e o CSV) ficam intactos
+            report_data = data.astype({
+                column: 'float32' for column in self.REPORT_COLUMNS
+                if column in data and data[column].dtype == 'float64'
+            })
+
+            # Estatísticas em uma única passada vetorizada
+            stats = report_data.agg({
+                'temperature_mean': 'mean',
+                'temperature_max': 'max',
+                'temperature_min': 'min',
+                'humidity_mean': 'mean',
+                'precipitation': 'sum'
+            })
+
+            lines = [
+                f"Relatório Climático Mensal - Montreal {report_date}\n",
+                "=" * 50 + "\n\n",
+                f"Temperatura média: {stats['temperature_mean']:.1f}°C\n",
+                f"Temperatura máxima: {stats['temperature_max']:.1f}°C\n",
+                f"Temperatura mínima: {stats['temperature_min']:.1f}°C\n",
+                f"Umidade média: {stats['humidity_mean']:.1f}%\n",
+                f"Precipitação total: {stats['precipitation']:.1f} mm\n",
+                f"Registros coletados: {len(data)}\n",
+            ]
+
             with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(f"Relatório Climático Mensal - Montreal {report_date}\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(f"Temperatura média: {data['temperature_mean'].mean():.1f}°C\n")
-                f.write(f"Temperatura máxima: {data['temperature_max'].max():.1f}°C\n")
-                f.write(f"Temperatura mínima: {data['temperature_min'].min():.1f}°C\n")
-                f.write(f"Umidade média: {data['humidity_mean'].mean():.1f}%\n")
-                f.write(f"Precipitação total: {data['precipitation'].sum():.1f} mm\n")
-                f.write(f"Registros coletados: {len(data)}\n")
+                f.writelines(lines)
 
             logger.info(f"Monthly report generated: {report_path}")
             return str(report_path)
@@ -113,6 +187,11 @@ class ContinuousClimateMonitor:
     def run_monitoring_cycle(self) -> bool:
         """Executa um ciclo completo de monitoramento"""
         logger.info("Starting monitoring cycle...")
+        # Cada ciclo busca dados novos; o cache só evita chamadas repetidas dentro dele
+        self._collection_cache.clear()
+
+        # Horário de referência único para todo o ciclo
+        now = datetime.now()
 
         try:
             # Coletar dados
@@ -121,13 +200,13 @@ class ContinuousClimateMonitor:
                 # Salvar como CSV
                 csv_path = self.open_meteo.save_to_csv(
                     data,
-                    filename=f"monitoring_{datetime.now().strftime('%Y%m%d')}.csv"
+                    filename=f"monitoring_{now.strftime('%Y%m%d')}.csv"
                 )
                 logger.info(f"Data saved to CSV: {csv_path}")
 
             # Gerar relatório mensal no dia 1
-            if datetime.now().day == 1:
-                self.generate_monthly_report()
+            if now.day == 1:
+                self.generate_monthly_report(data, now)
 
             logger.info("Monitoring cycle completed successfully")
             return True
@@ -136,16 +215,14 @@ class ContinuousClimateMonitor:
             logger.error(f"Error in monitoring cycle: {e}")
             return False
 
+        finally:
+            buffered_file_handler.flush()
+
     def run_continuous_monitoring(self):
         """Executa monitoramento contínuo"""
         logger.info("Starting continuous climate monitoring for Montreal (2025-2026)")
         logger.info("Monitoring schedule: 3 times per week (Mon, Wed, Fri)")
 
-        # Agendar execuções
-        schedule.every().monday.at("09:00").do(self.run_monitoring_cycle)
-        schedule.every().wednesday.at("09:00").do(self.run_monitoring_cycle)
-        schedule.every().friday.at("09:00").do(self.run_monitoring_cycle)
-
         # Executar imediatamente
         logger.info("Running initial monitoring cycle...")
         self.run_monitoring_cycle()
@@ -154,8 +231,18 @@ class ContinuousClimateMonitor:
 
         try:
             while True:
-                schedule.run_pending()
-                time.sleep(60)
+                # Dorme até a próxima coleta em vez de acordar a cada minuto
+                next_run = _next_monitoring_datetime(datetime.now(), self.MONITORING_DAYS, self.MONITORING_TIME)
+                logger.info(f"Next monitoring cycle scheduled for {next_run:%Y-%m-%d %H:%M}")
+                # Grava o log pendente antes de dormir por dias
+                buffered_file_handler.flush()
+                # time.sleep conta tempo real e next_run é hora local: dorme em blocos
+                # e confere o relógio a cada despertar, para que a troca de horário
+                # de verão não antecipe nem atrase a coleta
+                while datetime.now() < next_run:
+                    remaining = (next_run - datetime.now()).total_seconds()
+                    time.sleep(min(max(1.0, remaining), self.MAX_SLEEP_SECONDS))
+                self.run_monitoring_cycle()
         except KeyboardInterrupt:
             logger.info("Continuous monitoring stopped by user")
 
@@ -22,19 +22,92 @@ except ImportError:
     print("📦 Para instalar: pip install requests")
     print("🐳 Ou execute dentro do container: docker compose exec python_analytics python historical_weather_example.py")
     exit(1)
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import json
 import os
+import shelve
+import threading
 from pathlib import Path
 
 
 class HistoricalWeatherClient:
     """Cliente para acessar dados históricos do AerisWeather via API"""
 
-    def __init__(self, base_url="http://localhost:5000"):
+    # Timeout (conexão, leitura) em segundos
+    REQUEST_TIMEOUT = (3, 10)
+
+    def __init__(self, base_url="http://localhost:5000", cache_path=None):
         self.base_url = base_url
         self.api_prefix = "/api/v1/weather"
+        self.session = self._create_session()
+
+        # Cache de respostas condicionais: URL -> (ETag, Last-Modified, JSON).
+        # Com cache_path o cache é persistido em disco entre execuções.
+        self._etag_cache = shelve.open(str(cache_path)) if cache_path else {}
+        self._etag_lock = threading.Lock()
+
+    @staticmethod
+    def _create_session():
+        """Cria uma sessão HTTP persistente com pool de conexões e retentativas"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({
+            "User-Agent": "ETLWeatherHistoricalClient/1.0",
+            "Accept-Encoding": "gzip"
+        })
+        return session
+
+    def close(self):
+        """Fecha a sessão HTTP e libera as conexões do pool"""
+        self.session.close()
+        if isinstance(self._etag_cache, shelve.Shelf):
+            self._etag_cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _conditional_get(self, url, params):
+        """GET com If-None-Match/If-Modified-Since; reutiliza o JSON em respostas 304"""
+        cache_key = requests.Request('GET', url, params=params).prepare().url
+
+        with self._etag_lock:
+            cached = self._etag_cache.get(cache_key)
+
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        response = self.session.get(url, params=params, headers=headers, timeout=self.REQUEST_TIMEOUT)
+        if response.status_code == 304 and cached:
+            return cached[2]
+
+        response.raise_for_status()
+        data = response.json()
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            with self._etag_lock:
+                self._etag_cache[cache_key] = (etag, last_modified, data)
+
+        return data
 
     def get_historical_date(self, date, locations=None, fields=None):
         """Busca dados históricos de uma data específica"""
@@ -47,9 +120,7 @@ class HistoricalWeatherClient:
             params['fields'] = fields
 
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+            return self._conditional_get(url, params)
         except requests.exceptions.RequestException as e:
             print(f"Erro ao buscar dados históricos: {e}")
             return None
@@ -69,9 +140,7 @@ class HistoricalWeatherClient:
             params['fields'] = fields
 
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+            return self._conditional_get(url, params)
         except requests.exceptions.RequestException as e:
             print(f"Erro ao buscar intervalo histórico: {e}")
             return None
@@ -91,7 +160,7 @@ class HistoricalWeatherClient:
             params['fields'] = fields
 
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -105,62 +174,9 @@ def main():
     print("🌤️ ETL Weather Dashboard - Exemplos de Dados Históricos AerisWeather")
     print("=" * 70)
 
-    client = HistoricalWeatherClient()
-
-    # Exemplo 1: Dados de uma data específica
-    print("\n📅 Exemplo 1: Dados históricos de uma data específica")
-    print("-" * 50)
-
     yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-    result = client.get_historical_date(yesterday, locations=['montreal,ca'])
-
-    if result and result.get('success'):
-        print(f"✅ Dados encontrados para {yesterday}")
-        print(f"   Localizações: {result['locations']}")
-        print(f"   Registros: {result['count']}")
-        print(f"   Fonte: {result['source']}")
-    else:
-        print(f"❌ Nenhum dado encontrado para {yesterday}")
-        print("   Nota: Configure AERIS_CLIENT_ID e AERIS_CLIENT_SECRET para dados reais")
-
-    # Exemplo 2: Intervalo de datas
-    print("\n📊 Exemplo 2: Dados históricos em intervalo de datas")
-    print("-" * 50)
-
     start_date = (datetime.now() - timedelta(days=3)).strftime('%Y-%m-%d')
-    end_date = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-
-    result = client.get_historical_range(start_date, end_date, locations=['montreal,ca'])
-
-    if result and result.get('success'):
-        print(f"✅ Dados encontrados para período {start_date} até {end_date}")
-        print(f"   Datas com dados: {result['total_dates']}")
-        print(f"   Localizações: {result['locations']}")
-        print(f"   Fonte: {result['source']}")
-    else:
-        print(f"❌ Nenhum dado encontrado para o período {start_date} até {end_date}")
-
-    # Exemplo 3: Geração de CSVs
-    print("\n💾 Exemplo 3: Geração de arquivos CSV históricos")
-    print("-" * 50)
-
-    result = client.generate_historical_csvs(start_date, end_date, locations=['montreal,ca'])
-
-    if result and result.get('success'):
-        print(f"✅ CSVs gerados com sucesso!")
-        print(f"   Arquivos criados: {len(result['files'])}")
-        print(f"   Período: {result['date_range']['start']} até {result['date_range']['end']}")
-        print("   Arquivos:")
-        for file_path in result['files']:
-            print(f"     - {file_path}")
-    else:
-        print("❌ Falha ao gerar CSVs")
-        if result:
-            print(f"   Erro: {result.get('error', 'Erro desconhecido')}")
-
-    # Exemplo 4: Uso avançado com campos específicos
-    print("\n🔧 Exemplo 4: Uso avançado com campos específicos")
-    print("-" * 50)
+    end_date = yesterday
 
     custom_fields = [
         'periods.dateTimeISO',
@@ -170,21 +186,82 @@ def main():
         'periods.windSpeedKPH'
     ]
 
-    result = client.get_historical_date(
-        yesterday,
-        locations=['montreal,ca', 'toronto,ca'],
-        fields=custom_fields
-    )
-
-    if result and result.get('success'):
-        print(f"✅ Dados encontrados com campos específicos para {yesterday}")
-        print(f"   Localizações: {result['locations']}")
-        print(f"   Registros: {result['count']}")
-        print("   Campos solicitados:")
-        for field in custom_fields:
-            print(f"     - {field}")
-    else:
-        print(f"❌ Nenhum dado encontrado com campos específicos")
+    with HistoricalWeatherClient(cache_path=".historical_weather_cache") as client:
+        # As quatro chamadas são independentes: dispara todas em paralelo
+        # e imprime os resultados na ordem dos exemplos
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            date_future = executor.submit(client.get_historical_date, yesterday, locations=['montreal,ca'])
+            range_future = executor.submit(client.get_historical_range, start_date, end_date, locations=['montreal,ca'])
+            csv_future = executor.submit(client.generate_historical_csvs, start_date, end_date, locations=['montreal,ca'])
+            fields_future = executor.submit(
+                client.get_historical_date,
+                yesterday,
+                locations=['montreal,ca', 'toronto,ca'],
+                fields=custom_fields
+            )
+
+        # Exemplo 1: Dados de uma data específica
+        print("\n📅 Exemplo 1: Dados históricos de uma data específica")
+        print("-" * 50)
+
+        result = date_future.result()
+
+        if result and result.get('success'):
+            print(f"✅ Dados encontrados para {yesterday}")
+            print(f"   Localizações: {result['locations']}")
+            print(f"   Registros: {result['count']}")
+            print(f"   Fonte: {result['source']}")
+        else:
+            print(f"❌ Nenhum dado encontrado para {yesterday}")
+            print("   Nota: Configure AERIS_CLIENT_ID e AERIS_CLIENT_SECRET para dados reais")
+
+        # Exemplo 2: Intervalo de datas
+        print("\n📊 Exemplo 2: Dados históricos em intervalo de datas")
+        print("-" * 50)
+
+        result = range_future.result()
+
+        if result and result.get('success'):
+            print(f"✅ Dados encontrados para período {start_date} até {end_date}")
+            print(f"   Datas com dados: {result['total_dates']}")
+            print(f"   Localizações: {result['locations']}")
+            print(f"   Fonte: {result['source']}")
+        else:
+            print(f"❌ Nenhum dado encontrado para o período {start_date} até {end_date}")
+
+        # Exemplo 3: Geração de CSVs
+        print("\n💾 Exemplo 3: Geração de arquivos CSV históricos")
+        print("-" * 50)
+
+        result = csv_future.result()
+
+        if result and result.get('success'):
+            print(f"✅ CSVs gerados com sucesso!")
+            print(f"   Arquivos criados: {len(result['files'])}")
+            print(f"   Período: {result['date_range']['start']} até {result['date_range']['end']}")
+            print("   Arquivos:")
+            for file_path in result['files']:
+                print(f"     - {file_path}")
+        else:
+            print("❌ Falha ao gerar CSVs")
+            if result:
+                print(f"   Erro: {result.get('error', 'Erro desconhecido')}")
+
+        # Exemplo 4: Uso avançado com campos específicos
+        print("\n🔧 Exemplo 4: Uso avançado com campos específicos")
+        print("-" * 50)
+
+        result = fields_future.result()
+
+        if result and result.get('success'):
+            print(f"✅ Dados encontrados com campos específicos para {yesterday}")
+            print(f"   Localizações: {result['locations']}")
+            print(f"   Registros: {result['count']}")
+            print("   Campos solicitados:")
+            for field in custom_fields:
+                print(f"     - {field}")
+        else:
+            print(f"❌ Nenhum dado encontrado com campos específicos")
 
     print("\n" + "=" * 70)
     print("🎯 Para usar dados reais:")
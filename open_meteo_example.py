@@ -13,89 +13,186 @@ Características do Open-Meteo:
 - Melhor para monitoramento semi-real
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
-from datetime import datetime, date, timedelta
+from datetime import date, timedelta
 import json
+import time
 
 
 class OpenMeteoClient:
     """Cliente para acessar dados do Open-Meteo API"""
 
+    # Timeout (conexão, leitura) em segundos
+    REQUEST_TIMEOUT = (3.05, 27)
+
+    # Tempo de vida (segundos) das respostas em cache, por endpoint
+    CACHE_TTL = {
+        'current': 300,
+        'forecast': 900,
+        'historical': 86400
+    }
+
+    # Caminhos dos endpoints Open-Meteo do dashboard
+    ENDPOINTS = {
+        'current': '/openmeteo/current',
+        'forecast': '/openmeteo/forecast',
+        'monitoring': '/openmeteo/monitoring',
+        'historical': '/openmeteo/historical',
+        'historical_csv': '/openmeteo/historical/csv',
+        'batch': '/openmeteo/batch'
+    }
+
     def __init__(self, base_url="http://localhost:5000"):
         self.base_url = base_url
         self.api_prefix = "/api/v1/weather"
-
-    def get_current_weather(self):
-        """Busca dados climáticos atuais via API do dashboard"""
-        url = f"{self.base_url}{self.api_prefix}/openmeteo/current"
+        # URLs montadas uma única vez, em vez de a cada chamada
+        self._urls = {
+            key: f"{base_url}{self.api_prefix}{path}"
+            for key, path in self.ENDPOINTS.items()
+        }
+        self.session = self._create_session()
+        self._cache = {}
+        # Validadores HTTP: chave -> (ETag, JSON)
+        self._etags = {}
+
+    @staticmethod
+    def _create_session():
+        """Cria uma sessão HTTP persistente com pool de conexões e retentativas"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _cache_get(self, key):
+        """Retorna a resposta em cache para a chave, se ainda válida"""
+        entry = self._cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _cache_set(self, key, value):
+        """Guarda a resposta com o TTL do endpoint (primeiro elemento da chave)"""
+        if value is not None:
+            self._cache[key] = (time.monotonic() + self.CACHE_TTL[key[0]], value)
+        return value
+
+    def close(self):
+        """Fecha a sessão HTTP e libera as conexões do pool"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _get(self, key, params=None, error_message="Erro na requisição"):
+        """GET no endpoint indicado, com cache para os endpoints em CACHE_TTL
+
+        Respostas com ETag são revalidadas com If-None-Match: um 304 reaproveita
+        o JSON já baixado.
+        """
+        cache_key = (key, *params.values()) if params else (key,)
+        cacheable = key in self.CACHE_TTL
+        if cacheable:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        validator = self._etags.get(cache_key)
+        headers = {'If-None-Match': validator[0]} if validator else None
 
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Erro ao buscar dados atuais: {e}")
+            response = self.session.get(self._urls[key], params=params, headers=headers, timeout=self.REQUEST_TIMEOUT)
+            if response.status_code == 304 and validator:
+                data = validator[1]
+            else:
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                etag = response.headers.get('ETag')
+                if etag:
+                    self._etags[cache_key] = (etag, data)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # ValueError: corpo que não é JSON (página de erro de um proxy, etc.)
+            print(f"{error_message}: {e}")
             return None
 
+        return self._cache_set(cache_key, data) if cacheable else data
+
+    def get_current_weather(self):
+        """Busca dados climáticos atuais via API do dashboard"""
+        return self._get('current', error_message="Erro ao buscar dados atuais")
+
     def get_forecast(self, days=7):
         """Busca previsão do tempo via API do dashboard"""
-        url = f"{self.base_url}{self.api_prefix}/openmeteo/forecast"
-        params = {'days': days}
-
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Erro ao buscar previsão: {e}")
-            return None
+        return self._get('forecast', {'days': days}, "Erro ao buscar previsão")
 
     def get_monitoring_data(self, weeks=4):
         """Busca dados de monitoramento semanal (3-4 vezes por semana)"""
-        url = f"{self.base_url}{self.api_prefix}/openmeteo/monitoring"
-        params = {'weeks': weeks}
-
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Erro ao buscar dados de monitoramento: {e}")
-            return None
+        return self._get('monitoring', {'weeks': weeks}, "Erro ao buscar dados de monitoramento")
 
     def get_historical_data(self, start_date, end_date):
         """Busca dados históricos via API do dashboard"""
-        url = f"{self.base_url}{self.api_prefix}/openmeteo/historical"
         params = {
             'start_date': start_date,
             'end_date': end_date
         }
+        return self._get('historical', params, "Erro ao buscar dados históricos")
 
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Erro ao buscar dados históricos: {e}")
-            return None
+    def generate_historical_csv(self, start_date, end_date, output_dir="csv_output"):
+        """Baixa o CSV histórico gravando os blocos no disco conforme chegam
 
-    def generate_historical_csv(self, start_date, end_date):
-        """Gera CSV com dados históricos"""
-        url = f"{self.base_url}{self.api_prefix}/openmeteo/historical/csv"
+        Retorna o caminho do arquivo salvo (None em caso de erro).
+        """
+        url = self._urls['historical_csv']
         params = {
             'start_date': start_date,
             'end_date': end_date
         }
+        file_path = os.path.join(output_dir, f"openmeteo_historical_{start_date}_{end_date}.csv")
 
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+            with self.session.get(url, params=params, stream=True, timeout=self.REQUEST_TIMEOUT) as response:
+                response.raise_for_status()
+                os.makedirs(output_dir, exist_ok=True)
+                # iter_content já descompacta gzip, ao contrário de response.raw
+                with open(file_path, 'wb') as csv_file:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        csv_file.write(chunk)
+            return file_path
         except requests.exceptions.RequestException as e:
             print(f"Erro ao gerar CSV histórico: {e}")
             return None
 
+    def get_batch(self, operations):
+        """Executa várias consultas Open-Meteo em uma única requisição ao dashboard
+
+        Retorna a lista de respostas na mesma ordem das operações (None em caso de erro).
+        """
+        url = self._urls['batch']
+
+        try:
+            response = self.session.post(url, json={'requests': operations}, timeout=self.REQUEST_TIMEOUT)
+            response.raise_for_status()
+            results = orjson.loads(response.content)['results']
+            return [item['body'] if item['status'] < 400 else None for item in results]
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+            # ValueError: corpo que não é JSON; KeyError: resposta de erro sem 'results'
+            print(f"Erro ao executar lote de consultas: {e}")
+            return [None] * len(operations)
+
 
 def main():
     """Função principal com exemplos de uso do Open-Meteo"""
@@ -104,13 +201,35 @@ def main():
     print("📍 Melhor API gratuita para monitoramento semi-real de Montreal")
     print("=" * 70)
 
-    client = OpenMeteoClient()
+    # Último mês
+    end_date = date.today()
+    start_date = end_date - timedelta(days=30)
+
+    date_params = {
+        'start_date': start_date.strftime('%Y-%m-%d'),
+        'end_date': end_date.strftime('%Y-%m-%d')
+    }
+
+    # As quatro consultas JSON vão em um único lote (o servidor as executa em
+    # paralelo) enquanto o CSV, que vem em streaming direto para o disco, é
+    # baixado ao mesmo tempo por outra conexão do pool
+    with OpenMeteoClient() as client, ThreadPoolExecutor(max_workers=2) as executor:
+        batch_future = executor.submit(client.get_batch, [
+            {'op': 'current'},
+            {'op': 'forecast', 'days': 7},
+            {'op': 'monitoring', 'weeks': 4},
+            {'op': 'historical', **date_params}
+        ])
+        csv_future = executor.submit(client.generate_historical_csv, **date_params)
+
+        current, forecast, monitoring, historical = batch_future.result()
+        csv_path = csv_future.result()
 
     # Exemplo 1: Dados atuais (melhor para monitoramento em tempo real)
     print("\n📊 Exemplo 1: Dados climáticos atuais (Monitoramento em Tempo Real)")
     print("-" * 60)
 
-    result = client.get_current_weather()
+    result = current
 
     if result and result.get('success'):
         weather = result['data']
@@ -130,16 +249,17 @@ def main():
     print("\n🌤️ Exemplo 2: Previsão do tempo para 7 dias")
     print("-" * 60)
 
-    result = client.get_forecast(days=7)
+    result = forecast
 
     if result and result.get('success'):
         forecast = result['data']
         print(f"✅ Previsão obtida para {len(forecast)} dias:")
         print("<10")
-        for i, day in enumerate(forecast[:5]):  # Mostra apenas os primeiros 5 dias
-            date_obj = datetime.strptime(day['date'], '%Y-%m-%d')
-            weekday = date_obj.strftime('%A')
-            print(f"   {weekday[:3]}: {day['temperature_max']}°C / {day['temperature_min']}°C")
+        shown = forecast[:5]  # Mostra apenas os primeiros 5 dias
+        # Conversão das datas de uma só vez, com formato fixo
+        weekdays = pd.to_datetime([day['date'] for day in shown], format='%Y-%m-%d', cache=True).strftime('%a')
+        for weekday, day in zip(weekdays, shown):
+            print(f"   {weekday}: {day['temperature_max']}°C / {day['temperature_min']}°C")
         print(f"   ... e mais {len(forecast)-5} dias")
         print(f"   Fonte: {result['source']}")
     else:
@@ -149,7 +269,7 @@ def main():
     print("\n📅 Exemplo 3: Monitoramento semanal (3 vezes por semana)")
     print("-" * 60)
 
-    result = client.get_monitoring_data(weeks=4)
+    result = monitoring
 
     if result and result.get('success'):
         summary = result['summary']
@@ -178,14 +298,7 @@ def main():
     print("\n📈 Exemplo 4: Dados históricos mensais")
     print("-" * 60)
 
-    # Último mês
-    end_date = date.today()
-    start_date = end_date - timedelta(days=30)
-
-    result = client.get_historical_data(
-        start_date.strftime('%Y-%m-%d'),
-        end_date.strftime('%Y-%m-%d')
-    )
+    result = historical
 
     if result and result.get('success'):
         data = result['data']
@@ -197,13 +310,17 @@ def main():
         print(f"   Nota: {result['note']}")
 
         if len(data) > 0:
-            # Mostra estatísticas básicas
-            temps = [d.get('temperature_mean', 0) for d in data if d.get('temperature_mean')]
-            if temps:
+            # Mostra estatísticas básicas (uma passada, sem lista intermediária,
+            # ignorando valores ausentes)
+            temps = np.fromiter(
+                (d['temperature_mean'] for d in data if d.get('temperature_mean') is not None),
+                dtype=np.float64
+            )
+            if temps.size:
                 print("   📊 Estatísticas do período:")
-                print(f"      Temperatura média: {sum(temps)/len(temps):.1f}°C")
-                print(f"      Temperatura máxima: {max(temps):.1f}°C")
-                print(f"      Temperatura mínima: {min(temps):.1f}°C")
+                print(f"      Temperatura média: {temps.mean():.1f}°C")
+                print(f"      Temperatura máxima: {temps.max():.1f}°C")
+                print(f"      Temperatura mínima: {temps.min():.1f}°C")
     else:
         print("❌ Erro ao obter dados históricos")
 
@@ -211,19 +328,12 @@ def main():
     print("\n💾 Exemplo 5: Geração de arquivo CSV histórico")
     print("-" * 60)
 
-    result = client.generate_historical_csv(
-        start_date.strftime('%Y-%m-%d'),
-        end_date.strftime('%Y-%m-%d')
-    )
-
-    if result and result.get('success'):
+    if csv_path:
         print("✅ Arquivo CSV gerado com sucesso!")
-        print(f"   Arquivo: {result['file_path']}")
-        print(f"   Período: {result['date_range']['start']} até {result['date_range']['end']}")
-        print(f"   Dias: {result['date_range']['days']}")
-        print(f"   Localizações: {result['locations']}")
-        print(f"   Fonte: {result['source']}")
-        print("   💡 O arquivo CSV foi salvo no diretório csv_output/ do container")
+        print(f"   Arquivo: {csv_path}")
+        print(f"   Período: {date_params['start_date']} até {date_params['end_date']}")
+        print("   Fonte: Open-Meteo")
+        print("   💡 O arquivo CSV foi salvo localmente em csv_output/")
     else:
         print("❌ Erro ao gerar CSV histórico")
 
@@ -1,8 +1,11 @@
 import logging
 import os
 import time
-from flask import Flask, render_template, g
+from types import SimpleNamespace
+import orjson
+from flask import Flask, Response, render_template, request, g
 from flask_cors import CORS
+from flask_compress import Compress
 
 from .api.weather_api import weather_bp
 from .services.database_service import DatabaseService
@@ -11,6 +14,8 @@ from .services.aeris_weather_service import AerisWeatherService
 from .services.open_meteo_service import OpenMeteoService
 from .services.weatherapi_service import WeatherAPIService
 from .utils.config import Config
+from .utils.cache import TTLCache
+from .utils.json_provider import OrjsonProvider
 
 # Configure logging
 logging.basicConfig(
@@ -19,12 +24,51 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+WRITE_METHODS = frozenset({'POST', 'PUT', 'DELETE', 'PATCH'})
+
+# The root endpoint payload is static, so it is serialized once at import
+_INDEX_BYTES = orjson.dumps({
+    'message': 'Montreal Weather Dashboard API',
+    'version': '1.0.0',
+    'status': 'running',
+    'endpoints': {
+        'health': '/api/v1/weather/health',
+        'latest': '/api/v1/weather/latest',
+        'latest_ndjson': '/api/v1/weather/latest.ndjson?limit=1000',
+        'current': '/api/v1/weather/current',
+        'stats': '/api/v1/weather/stats',
+        'chart_data': '/api/v1/weather/chart-data',
+        'aeris_montreal': '/api/v1/weather/aeris/montreal',
+        'aeris_csv': '/api/v1/weather/aeris/montreal/csv',
+        'aeris_locations': '/api/v1/weather/aeris/locations?locations=montreal,ca&locations=toronto,ca',
+        'aeris_historical_date': '/api/v1/weather/aeris/historical/2024-01-01',
+        'aeris_historical_range': '/api/v1/weather/aeris/historical?start_date=2024-01-01&end_date=2024-01-05',
+        'aeris_historical_csv': '/api/v1/weather/aeris/historical/csv?start_date=2024-01-01&end_date=2024-01-05',
+        'openmeteo_current': '/api/v1/weather/openmeteo/current',
+        'openmeteo_forecast': '/api/v1/weather/openmeteo/forecast?days=7',
+        'openmeteo_historical': '/api/v1/weather/openmeteo/historical?start_date=2024-01-01&end_date=2024-01-31',
+        'openmeteo_monitoring': '/api/v1/weather/openmeteo/monitoring?weeks=4',
+        'openmeteo_csv': '/api/v1/weather/openmeteo/historical/csv?start_date=2024-01-01&end_date=2024-01-31',
+        'openmeteo_batch': 'POST /api/v1/weather/openmeteo/batch',
+        'long_term_monitoring': '/api/v1/weather/openmeteo/long-term?years=2',
+        'seasonal_analysis': '/api/v1/weather/openmeteo/seasonal-analysis?years=2',
+        'yearly_trends': '/api/v1/weather/openmeteo/yearly-trends?years=2',
+        'monitoring_status': '/api/v1/weather/monitoring/status',
+        'weatherapi_current': '/api/v1/weather/weatherapi/current',
+        'weatherapi_forecast': '/api/v1/weather/weatherapi/forecast?days=7',
+        'weatherapi_realtime': '/api/v1/weather/weatherapi/realtime',
+        'weatherapi_status': '/api/v1/weather/weatherapi/status',
+        'dashboard': '/dashboard'
+    }
+})
+
 
 def create_app(config_class=None) -> Flask:
     """Create and configure the Flask application"""
     app = Flask(__name__,
                 template_folder="templates",
                 static_folder="static")
+    app.json = OrjsonProvider(app)
 
     # Load configuration
     if config_class is None:
@@ -58,6 +102,17 @@ def create_app(config_class=None) -> Flask:
          max_age=86400  # 24 hours
     )
 
+    # Compress JSON responses (record lists repeat the same keys). Streamed
+    # responses such as the historical CSV are left alone: compressing them
+    # would buffer the whole body in memory
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_LEVEL'] = 4
+    app.config['COMPRESS_BR_LEVEL'] = 4
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    app.config['COMPRESS_STREAMS'] = False
+    Compress(app)
+
     # Initialize services
     db_service = DatabaseService(app.config['DATABASE_URL'])
     alert_service = AlertService()
@@ -71,6 +126,13 @@ def create_app(config_class=None) -> Flask:
     app.config['aeris_weather_service'] = aeris_weather_service
     app.config['open_meteo_service'] = open_meteo_service
     app.config['weatherapi_service'] = weatherapi_service
+    app.extensions['weather'] = SimpleNamespace(
+        db=db_service,
+        alert=alert_service,
+        aeris=aeris_weather_service,
+        openmeteo=open_meteo_service,
+        weatherapi=weatherapi_service
+    )
 
     # Register blueprints
     app.register_blueprint(weather_bp, url_prefix='/api/v1/weather')
@@ -79,39 +141,47 @@ def create_app(config_class=None) -> Flask:
     @app.before_request
     def log_request_info():
         """Log security-relevant request information"""
-        client_ip = request.remote_addr or request.headers.get('X-Forwarded-For', 'unknown')
-        user_agent = request.headers.get('User-Agent', 'unknown')
         method = request.method
         path = request.path
-        query_string = request.query_string.decode('utf-8') if request.query_string else ''
+        is_api = path.startswith('/api/')
+
+        # Static files and templates only matter here for security events
+        if not is_api and method not in WRITE_METHODS:
+            return
+
+        client_ip = request.remote_addr or request.headers.get('X-Forwarded-For', 'unknown')
 
         # Log security events
-        if method in ['POST', 'PUT', 'DELETE', 'PATCH']:
-            logger.warning(f"SECURITY: {method} request to {path} from {client_ip}")
+        if method in WRITE_METHODS:
+            logger.warning("SECURITY: %s request to %s from %s", method, path, client_ip)
+
+        if not is_api:
+            return
 
         # Log all API requests for monitoring
-        if path.startswith('/api/'):
-            logger.info(f"API_REQUEST: {method} {path} from {client_ip} - UA: {user_agent[:50]}...")
+        user_agent = request.headers.get('User-Agent', 'unknown')
+        logger.info("API_REQUEST: %s %s from %s - UA: %.50s...", method, path, client_ip, user_agent)
 
         # Store request info for potential security analysis
-        g.request_start_time = time.time()
+        g.request_start_time = time.monotonic()
         g.client_ip = client_ip
         g.user_agent = user_agent
 
     @app.after_request
     def log_response_info(response):
         """Log response information and timing"""
-        if hasattr(g, 'request_start_time'):
-            duration = time.time() - g.request_start_time
+        start_time = g.get('request_start_time')
+        if start_time is not None:
+            duration = time.monotonic() - start_time
             status_code = response.status_code
-            client_ip = getattr(g, 'client_ip', 'unknown')
+            client_ip = g.get('client_ip', 'unknown')
 
             # Log slow requests or errors
             if duration > 5.0:  # 5 seconds
-                logger.warning(f"SLOW_REQUEST: {request.method} {request.path} took {duration:.2f}s from {client_ip}")
+                logger.warning("SLOW_REQUEST: %s %s took %.2fs from %s", request.method, request.path, duration, client_ip)
 
             if status_code >= 400:
-                logger.warning(f"ERROR_RESPONSE: {status_code} for {request.method} {request.path} from {client_ip}")
+                logger.warning("ERROR_RESPONSE: %s for %s %s from %s", status_code, request.method, request.path, client_ip)
 
         return response
 
@@ -122,38 +192,7 @@ def create_app(config_class=None) -> Flask:
     @app.route('/')
     def index():
         """Root endpoint with API information"""
-        return {
-            'message': 'Montreal Weather Dashboard API',
-            'version': '1.0.0',
-            'status': 'running',
-            'endpoints': {
-                'health': '/api/v1/weather/health',
-                'latest': '/api/v1/weather/latest',
-                'current': '/api/v1/weather/current',
-                'stats': '/api/v1/weather/stats',
-                'chart_data': '/api/v1/weather/chart-data',
-                'aeris_montreal': '/api/v1/weather/aeris/montreal',
-                'aeris_csv': '/api/v1/weather/aeris/montreal/csv',
-                'aeris_locations': '/api/v1/weather/aeris/locations?locations=montreal,ca&locations=toronto,ca',
-                'aeris_historical_date': '/api/v1/weather/aeris/historical/2024-01-01',
-                'aeris_historical_range': '/api/v1/weather/aeris/historical?start_date=2024-01-01&end_date=2024-01-05',
-                'aeris_historical_csv': '/api/v1/weather/aeris/historical/csv?start_date=2024-01-01&end_date=2024-01-05',
-                'openmeteo_current': '/api/v1/weather/openmeteo/current',
-                'openmeteo_forecast': '/api/v1/weather/openmeteo/forecast?days=7',
-                'openmeteo_historical': '/api/v1/weather/openmeteo/historical?start_date=2024-01-01&end_date=2024-01-31',
-                'openmeteo_monitoring': '/api/v1/weather/openmeteo/monitoring?weeks=4',
-                'openmeteo_csv': '/api/v1/weather/openmeteo/historical/csv?start_date=2024-01-01&end_date=2024-01-31',
-                'long_term_monitoring': '/api/v1/weather/openmeteo/long-term?years=2',
-                'seasonal_analysis': '/api/v1/weather/openmeteo/seasonal-analysis?years=2',
-                'yearly_trends': '/api/v1/weather/openmeteo/yearly-trends?years=2',
-                'monitoring_status': '/api/v1/weather/monitoring/status',
-                'weatherapi_current': '/api/v1/weather/weatherapi/current',
-                'weatherapi_forecast': '/api/v1/weather/weatherapi/forecast?days=7',
-                'weatherapi_realtime': '/api/v1/weather/weatherapi/realtime',
-                'weatherapi_status': '/api/v1/weather/weatherapi/status',
-                'dashboard': '/dashboard'
-            }
-        }
+        return Response(_INDEX_BYTES, mimetype='application/json')
 
     logger.info("Flask application created successfully")
     return app
@@ -161,20 +200,31 @@ def create_app(config_class=None) -> Flask:
 
 def register_routes(app: Flask):
     """Register additional routes"""
+    # Services are bound once here rather than looked up in app.config per request
+    services = app.extensions['weather']
+
+    # Rapid dashboard refreshes are served from memory instead of Postgres
+    dashboard_cache = TTLCache(ttl=30, maxsize=1)
+
+    def load_dashboard_data():
+        """Fetch the latest reading and 24h chart data from the database"""
+        db_service = services.db
+        latest_weather = db_service.get_latest_weather()
+
+        # Get chart data for the last 24 hours
+        chart_weather = db_service.get_weather_data(limit=24)
+        trend = chart_weather.get_temperature_trend(24)
+        chart_data = {
+            'temperature': trend,
+            'humidity': [{'timestamp': item['timestamp'], 'humidity': item['humidity']} for item in trend]
+        }
+        return latest_weather, chart_data
+
     @app.route('/dashboard')
     def dashboard():
         """Serve the dashboard page"""
         try:
-            db_service = app.config['db_service']
-            weather_data = db_service.get_weather_data(limit=1)
-            latest_weather = weather_data.get_latest()
-
-            # Get chart data for the last 24 hours
-            chart_weather = db_service.get_weather_data(limit=48)  # More data for charts
-            chart_data = {
-                'temperature': chart_weather.get_temperature_trend(24),
-                'humidity': [{'timestamp': item['timestamp'], 'humidity': item['humidity']} for item in chart_weather.get_temperature_trend(24)]
-            }
+            latest_weather, chart_data = dashboard_cache.get_or_set('dashboard', load_dashboard_data)
 
             return render_template('dashboard.html',
                                    latest_weather=latest_weather,
@@ -182,17 +232,11 @@ def register_routes(app: Flask):
 
         except Exception as e:
             logger.error(f"Dashboard error: {e}")
-            alert_service = app.config['alert_service']
-            alert_service.send_error_alert(str(e), "dashboard")
+            services.alert.send_error_alert(str(e), "dashboard")
             return "Dashboard temporarily unavailable", 500
 
 
-if __name__ == "__main__":
-    app = create_app()
-    logger.info("Starting Montreal Weather Dashboard server...")
-
-    app.run(
-        host=os.getenv("FLASK_HOST", "0.0.0.0"),
-        port=int(os.getenv("FLASK_PORT", "5000")),
-        debug=os.getenv("FLASK_DEBUG", "False").lower() == "true"
-    )
+# Não há servidor embutido: o servidor de desenvolvimento do Flask não é
+# feito para produção. Para rodar localmente, a partir de python_analytics/:
+#   gunicorn -c gunicorn_conf.py 'app:create_app()'
+# ou, com reload, flask --app 'app:create_app()' run --debug
@@ -1,8 +1,12 @@
+import logging
 import os
-import requests
 from dotenv import load_dotenv
+
+from .services.alert_service import AlertService
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 
@@ -11,7 +15,7 @@ def send_alert(message: str):
     if TELEGRAM_TOKEN and TELEGRAM_CHAT_ID:
         url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage"
         payload = {"chat_id": TELEGRAM_CHAT_ID, "text": message}
-        try:
-            requests.post(url, json=payload, timeout=10)
-        except Exception as e:
-            print("Failed to send alert:", e)
+        # Delivered by AlertService's background thread, started on first use,
+        # so the failing route never waits on api.telegram.org
+        if not AlertService.enqueue(url, payload):
+            logger.warning("Alert queue full, dropping alert: %s", message)
@@ -1,22 +1,42 @@
 import logging
+import re
+import threading
 import time
 import functools
 import base64
-from collections import defaultdict
-from flask import Blueprint, jsonify, request, current_app, g, make_response
-from typing import Dict, Any
-from datetime import datetime, timedelta
+import hmac
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from flask import Blueprint, Response, jsonify, request, current_app, g, make_response, stream_with_context
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
+from datetime import date, datetime, timedelta, timezone
+import orjson
 import pandas as pd
 from ..services.database_service import DatabaseService
 from ..services.alert_service import AlertService
 from ..services.aeris_weather_service import AerisWeatherService
 from ..services.open_meteo_service import OpenMeteoService
 from ..services.weatherapi_service import WeatherAPIService
+from ..utils.cache import TTLCache
+from ..utils.json_provider import OrjsonProvider
+from ..utils.stats import summarize
 
 logger = logging.getLogger(__name__)
 weather_bp = Blueprint('weather', __name__)
 
+
+@weather_bp.record_once
+def use_orjson_provider(state):
+    """Serialize the blueprint's jsonify responses with orjson on any host app"""
+    if not isinstance(state.app.json, OrjsonProvider):
+        state.app.json = OrjsonProvider(state.app)
+
+
 # Security and validation utilities
+DATE_PARAM_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+UNSAFE_CHARS_RE = re.compile(r'[^\w\s\-_]')
+
+
 def validate_limit_param(limit_str: str, min_val: int = 1, max_val: int = 1000) -> int:
     """Validate and sanitize limit parameter"""
     try:
@@ -33,46 +53,62 @@ def validate_hours_param(hours_str: str) -> int:
     except (ValueError, TypeError):
         return 24  # Default to 24 hours
 
+def clamp_int(value: Any, default: int, min_val: int, max_val: int) -> int:
+    """Clamp an integer-like value to [min_val, max_val]; default if missing or invalid"""
+    if value is None:
+        return default
+    try:
+        return min(max(int(value), min_val), max_val)
+    except (TypeError, ValueError):
+        return default
+
+def clamped_int_param(name: str, default: int, min_val: int, max_val: int) -> int:
+    """Read an integer query parameter clamped to [min_val, max_val]; default if missing or invalid"""
+    return clamp_int(request.args.get(name), default, min_val, max_val)
+
+def unique_list_param(name: str) -> List[str]:
+    """Values of a repeated query parameter, first-seen order, duplicates dropped"""
+    return list(dict.fromkeys(request.args.getlist(name)))
+
 def validate_date_param(date_str: str) -> str:
     """Validate and sanitize date parameter"""
-    import re
     # Only allow YYYY-MM-DD format
-    if not re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
+    if not DATE_PARAM_RE.match(date_str):
         raise ValueError("Invalid date format. Use YYYY-MM-DD")
 
     # Try to parse as actual date to ensure validity
     try:
-        datetime.strptime(date_str, '%Y-%m-%d').date()
+        date.fromisoformat(date_str)
         return date_str
     except ValueError:
         raise ValueError("Invalid date value. Use YYYY-MM-DD")
 
+def parse_date_param(date_str: str) -> date:
+    """Parse a strict YYYY-MM-DD parameter; raises ValueError otherwise"""
+    if not date_str or not DATE_PARAM_RE.match(date_str):
+        raise ValueError("Invalid date format. Use YYYY-MM-DD")
+    return date.fromisoformat(date_str)
+
 def sanitize_string_param(param: str, max_length: int = 100) -> str:
     """Sanitize string parameters to prevent injection"""
     if not param:
         return ""
     # Remove potentially dangerous characters
-    import re
-    sanitized = re.sub(r'[^\w\s\-_]', '', param)[:max_length]
+    sanitized = UNSAFE_CHARS_RE.sub('', param)[:max_length]
     return sanitized.strip()
 
-# Security decorator
-def add_security_headers(response):
-    """Add modern security headers to response"""
+# Security headers, built once and applied to every blueprint response
+SECURITY_HEADERS = {
     # Prevent clickjacking
-    response.headers['X-Frame-Options'] = 'DENY'
-
+    'X-Frame-Options': 'DENY',
     # Prevent MIME type sniffing
-    response.headers['X-Content-Type-Options'] = 'nosniff'
-
+    'X-Content-Type-Options': 'nosniff',
     # Enable XSS protection
-    response.headers['X-XSS-Protection'] = '1; mode=block'
-
+    'X-XSS-Protection': '1; mode=block',
     # Referrer policy
-    response.headers['Referrer-Policy'] = 'strict-origin-when-cross-origin'
-
+    'Referrer-Policy': 'strict-origin-when-cross-origin',
     # Content Security Policy (restrictive)
-    response.headers['Content-Security-Policy'] = (
+    'Content-Security-Policy': (
         "default-src 'self'; "
         "script-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://cdn.plot.ly; "
         "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com https://cdnjs.cloudflare.com; "
@@ -80,51 +116,62 @@ def add_security_headers(response):
         "img-src 'self' data: https:; "
         "connect-src 'self'; "
         "frame-ancestors 'none';"
-    )
-
+    ),
     # HSTS (HTTP Strict Transport Security) - only for HTTPS
-    # response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
+    # 'Strict-Transport-Security': 'max-age=31536000; includeSubDomains',
+}
 
-    # Remove server header for security
-    response.headers.pop('Server', None)
 
+# Security decorator
+def add_security_headers(response):
+    """Add modern security headers to response"""
+    response.headers.update(SECURITY_HEADERS)
     return response
 
 # Rate limiting implementation
 class RateLimiter:
-    """Simple in-memory rate limiter"""
+    """Simple in-memory rate limiter (token bucket per client)"""
 
     def __init__(self):
-        self.requests = defaultdict(list)
+        # client -> (tokens left, monotonic time of the last refill), least
+        # recently seen first so spoofed/one-off clients are evicted first
+        self.requests: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
         self.max_requests = 100  # requests per window
         self.window_seconds = 60  # 1 minute window
+        self.max_clients = 50_000
+        # Threaded/gevent workers run requests concurrently; the read-modify-write
+        # of a bucket must not interleave
+        self._lock = threading.Lock()
+
+    def is_allowed(self, client_ip: str, cost: int = 1) -> bool:
+        """Check if a request costing `cost` tokens is allowed"""
+        with self._lock:
+            now = time.monotonic()
+            tokens, last_refill = self.requests.get(client_ip, (self.max_requests, now))
 
-    def is_allowed(self, client_ip: str) -> bool:
-        """Check if request is allowed"""
-        now = time.time()
-        client_requests = self.requests[client_ip]
+            # Refill continuously at max_requests per window, up to a full bucket
+            tokens = min(self.max_requests, tokens + (now - last_refill) * self.max_requests / self.window_seconds)
 
-        # Remove old requests outside the window
-        client_requests[:] = [req_time for req_time in client_requests
-                            if now - req_time < self.window_seconds]
+            allowed = tokens >= cost
+            self.requests[client_ip] = (tokens - cost if allowed else tokens, now)
+            self.requests.move_to_end(client_ip)
 
-        # Check if under limit
-        if len(client_requests) >= self.max_requests:
-            return False
+            # An evicted client was idle the longest, so its bucket has most
+            # likely refilled anyway
+            if len(self.requests) > self.max_clients:
+                self.requests.popitem(last=False)
 
-        # Add current request
-        client_requests.append(now)
-        return True
+            return allowed
 
 # Global rate limiter instance
 rate_limiter = RateLimiter()
 
-def check_rate_limit():
+def check_rate_limit(cost: int = 1):
     """Rate limiting middleware"""
     client_ip = request.remote_addr or request.headers.get('X-Forwarded-For', 'unknown')
 
-    if not rate_limiter.is_allowed(client_ip):
-        logger.warning(f"Rate limit exceeded for IP: {client_ip}")
+    if not rate_limiter.is_allowed(client_ip, cost):
+        logger.warning("Rate limit exceeded for IP: %s", client_ip)
         return jsonify({
             'error': 'Too many requests. Please try again later.',
             'retry_after': rate_limiter.window_seconds
@@ -141,16 +188,20 @@ def check_basic_auth():
 
     try:
         # Decode base64 credentials
-        credentials = base64.b64decode(auth[6:]).decode('utf-8')
-        username, password = credentials.split(':', 1)
+        username, password = base64.b64decode(auth[6:]).split(b':', 1)
 
         # Check against environment variables or config
-        expected_username = current_app.config.get('ADMIN_USERNAME', 'admin')
-        expected_password = current_app.config.get('ADMIN_PASSWORD', 'admin123')
-
-        return username == expected_username and password == expected_password
+        config = current_app.config
+        expected_username = config.get('ADMIN_USERNAME', 'admin').encode('utf-8')
+        expected_password = config.get('ADMIN_PASSWORD', 'admin123').encode('utf-8')
+
+        # Constant-time comparisons, both always evaluated, so response timing
+        # reveals neither which field was wrong nor how much of it matched
+        username_ok = hmac.compare_digest(username, expected_username)
+        password_ok = hmac.compare_digest(password, expected_password)
+        return username_ok and password_ok
     except Exception as e:
-        logger.warning(f"Basic auth parsing error: {e}")
+        logger.warning("Basic auth parsing error: %s", e)
         return False
 
 def require_auth(f):
@@ -191,6 +242,158 @@ def secure_endpoint(f):
     return decorated_function
 
 
+RESPONSE_CACHE_SIZE = 256
+# Flask-Compress appends the content coding to ETags (W/"tag" -> W/"tag:gzip")
+ETAG_ENCODING_SUFFIXES = ('', ':br', ':gzip', ':zstd', ':deflate')
+CACHED_HEADERS = ('ETag', 'Cache-Control')
+# Upstream-bound routes: current conditions change within minutes, forecasts
+# hourly, and archive data for past dates essentially never
+UPSTREAM_CURRENT_TTL = 60
+UPSTREAM_FORECAST_TTL = 3600
+UPSTREAM_HISTORICAL_TTL = 24 * 3600
+
+
+def get_app_cache(name: str, ttl: float, maxsize: int = RESPONSE_CACHE_SIZE) -> TTLCache:
+    """Per-app TTLCache kept in app.extensions (each app and test app has its own)"""
+    cache = current_app.extensions.get(name)
+    if cache is None:
+        cache = current_app.extensions.setdefault(name, TTLCache(ttl=ttl, maxsize=maxsize))
+    return cache
+
+
+def historical_ttl() -> float:
+    """Server-side TTL for historical routes, from the request's end date
+
+    Only ranges entirely in the past keep the long TTL; one that ends today or
+    later can still change, so it gets the short upstream TTL.
+    """
+    end_date_str = request.args.get('end_date') or (request.view_args or {}).get('date')
+    try:
+        end_date = parse_date_param(end_date_str)
+    except ValueError:
+        return UPSTREAM_CURRENT_TTL
+    return UPSTREAM_HISTORICAL_TTL if end_date < date.today() else UPSTREAM_CURRENT_TTL
+
+
+def cached_response(ttl: Union[float, Callable[[], float]]):
+    """Decorator that caches successful responses per path and query string
+
+    The ETL writes on a fixed cadence, so entries simply expire after ttl
+    (a callable ttl is evaluated per request).
+    """
+    def decorator(f):
+        @functools.wraps(f)
+        def decorated_function(*args, **kwargs):
+            entry_ttl = ttl() if callable(ttl) else ttl
+            cache = get_app_cache('weather_response_cache', entry_ttl)
+
+            key = (request.path, tuple(sorted(request.args.items(multi=True))))
+            cached = cache.get(key)
+            if cached is not None:
+                body, headers, etag = cached
+                if etag and etag_matches(etag):
+                    return current_app.response_class(status=304, headers=headers)
+                return current_app.response_class(body, mimetype='application/json', headers=headers)
+
+            response = make_response(f(*args, **kwargs))
+            if response.status_code == 200:
+                headers = [(name, response.headers[name]) for name in CACHED_HEADERS if name in response.headers]
+                cache.set(key, (response.get_data(), headers, response.get_etag()[0]), ttl=entry_ttl)
+            return response
+
+        return decorated_function
+    return decorator
+
+
+def no_store(f):
+    """Decorator marking responses as never cacheable by browsers or proxies
+
+    For live status and credential-gated data; server-side caching (cached_response
+    inside this decorator) is unaffected.
+    """
+    @functools.wraps(f)
+    def decorated_function(*args, **kwargs):
+        response = make_response(f(*args, **kwargs))
+        response.cache_control.no_store = True
+        return response
+
+    return decorated_function
+
+
+def etag_matches(etag: str) -> bool:
+    """Whether If-None-Match weakly matches etag, in any content coding"""
+    if_none_match = request.if_none_match
+    return any(if_none_match.contains_weak(etag + suffix) for suffix in ETAG_ENCODING_SUFFIXES)
+
+
+def tagged_response(payload: Dict[str, Any], etag: str, max_age: int = 10):
+    """JSON response with a weak ETag built from the data's freshness
+
+    When the client already holds that ETag the payload is not serialized at
+    all and a 304 is returned instead.
+    """
+    if etag_matches(etag):
+        response = make_response('', 304)
+    else:
+        response = jsonify(payload)
+    response.set_etag(etag, weak=True)
+    response.cache_control.max_age = max_age
+    return response
+
+
+def conditional_response(payload: Dict[str, Any], max_age: Optional[int] = None):
+    """JSON response carrying a content ETag; 304 if the client already has it
+
+    max_age marks the payload as publicly cacheable, for data that no longer
+    changes (archive days in the past).
+    """
+    response = jsonify(payload)
+    response.add_etag()
+    etag = response.get_etag()[0]
+    if etag_matches(etag):
+        response = make_response('', 304)
+        response.set_etag(etag)
+    if max_age is not None:
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+    return response
+
+
+def records_json(df: pd.DataFrame) -> orjson.Fragment:
+    """DataFrame rows as pre-encoded JSON, to embed in a jsonify payload
+
+    pandas encodes the records in C straight from the columns instead of
+    building a list of per-row dicts for orjson to walk again.
+    """
+    return orjson.Fragment(df.to_json(orient='records', date_format='iso', date_unit='s'))
+
+
+def error_response(message: str, error: Exception, status: int = 500):
+    """JSON error response; the exception text is only exposed in debug mode"""
+    body = {'success': False, 'error': message}
+    if current_app.debug:
+        body['details'] = str(error)
+    return jsonify(body), status
+
+
+# Upper bound on rows a single JSON response may carry; checked before any
+# upstream call using the row count the query could produce
+MAX_RESPONSE_ROWS = 2000
+# Hourly periods requested from AerisWeather per location and day
+AERIS_HISTORICAL_ROWS_PER_DAY = 24
+
+
+def oversize_response(estimated_rows: int):
+    """413 JSON response when a query could exceed MAX_RESPONSE_ROWS, else None"""
+    if estimated_rows <= MAX_RESPONSE_ROWS:
+        return None
+    return jsonify({
+        'success': False,
+        'error': f'Query could return up to {estimated_rows} rows (max {MAX_RESPONSE_ROWS}); '
+                 'request fewer locations or a shorter date range'
+    }), 413
+
+
 def get_db_service() -> DatabaseService:
     """Get database service from app context"""
     return current_app.config['db_service']
@@ -211,30 +414,39 @@ def get_open_meteo_service() -> OpenMeteoService:
     return current_app.config['open_meteo_service']
 
 
+HEALTH_PROBE_TTL = 5
+
+
+def probe_database():
+    """Ping the database, returning (healthy, checked_at)"""
+    return get_db_service().health_check(), datetime.now(timezone.utc)
+
+
 @weather_bp.route('/health')
 @secure_endpoint
+@no_store
 def health_check():
     """Health check endpoint"""
     try:
-        db_service = get_db_service()
-        db_healthy = db_service.health_check()
+        # Probes share one database ping per HEALTH_PROBE_TTL seconds
+        health_cache = get_app_cache('weather_health_cache', HEALTH_PROBE_TTL, maxsize=1)
+        db_healthy, checked_at = health_cache.get_or_set('database', probe_database)
 
         return jsonify({
             'status': 'healthy' if db_healthy else 'unhealthy',
             'database': 'connected' if db_healthy else 'disconnected',
-            'timestamp': datetime.now().isoformat() + 'Z'
+            'checked_at': checked_at,
+            'timestamp': datetime.now(timezone.utc)
         }), 200 if db_healthy else 503
 
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        }), 500
+        logger.error("Health check failed: %s", e)
+        return error_response('Health check failed', e, 503)
 
 
 @weather_bp.route('/latest')
 @secure_endpoint
+@cached_response(ttl=30)
 def get_latest_weather():
     """Get latest weather data"""
     try:
@@ -244,39 +456,62 @@ def get_latest_weather():
         db_service = get_db_service()
         weather_data = db_service.get_weather_data(limit=limit)
 
-        return jsonify({
+        return conditional_response({
             'success': True,
             'count': len(weather_data.data),
             'data': weather_data.to_dict_list()
-        })
+        }, max_age=30)
 
     except Exception as e:
-        logger.error(f"Failed to fetch latest weather: {e}")
+        logger.error("Failed to fetch latest weather: %s", e)
         alert_service = get_alert_service()
         alert_service.send_error_alert(str(e), "latest weather endpoint")
 
-        return jsonify({
-            'success': False,
-            'error': 'Failed to fetch weather data',
-            'details': str(e)
-        }), 500
+        return error_response('Failed to fetch weather data', e)
+
+
+@weather_bp.route('/latest.ndjson')
+@secure_endpoint
+def stream_latest_weather():
+    """Stream latest weather data as newline-delimited JSON"""
+    try:
+        limit_param = request.args.get('limit', '100')
+        limit = validate_limit_param(limit_param)
+
+        db_service = get_db_service()
+        rows = db_service.iter_weather_data(limit=limit)
+        # Pull the first row before committing to a 200 so query errors
+        # still produce a proper error response
+        first = next(rows, None)
+
+    except Exception as e:
+        logger.error("Failed to stream latest weather: %s", e)
+        return error_response('Failed to fetch weather data', e)
+
+    def generate():
+        if first is None:
+            return
+        yield orjson.dumps(first.to_dict()) + b'\n'
+        for item in rows:
+            yield orjson.dumps(item.to_dict()) + b'\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
 
 
 @weather_bp.route('/current')
 @secure_endpoint
+@cached_response(ttl=10)
 def get_current_weather():
     """Get current (latest) weather conditions"""
     try:
         db_service = get_db_service()
-        weather_data = db_service.get_weather_data(limit=1)
-
-        latest = weather_data.get_latest()
+        latest = db_service.get_latest_weather()
 
         if latest:
-            return jsonify({
+            return tagged_response({
                 'success': True,
                 'data': latest.to_dict()
-            })
+            }, etag=f"{latest.timestamp}-1")
         else:
             return jsonify({
                 'success': False,
@@ -284,20 +519,18 @@ def get_current_weather():
             }), 404
 
     except Exception as e:
-        logger.error(f"Failed to fetch current weather: {e}")
+        logger.error("Failed to fetch current weather: %s", e)
         alert_service = get_alert_service()
         alert_service.send_error_alert(str(e), "current weather endpoint")
 
-        return jsonify({
-            'success': False,
-            'error': 'Failed to fetch current weather',
-            'details': str(e)
-        }), 500
+        return error_response('Failed to fetch current weather', e)
 
 
 @weather_bp.route('/stats')
 @require_auth
 @secure_endpoint
+@no_store
+@cached_response(ttl=60)
 def get_weather_stats():
     """Get weather statistics"""
     try:
@@ -310,19 +543,16 @@ def get_weather_stats():
         })
 
     except Exception as e:
-        logger.error(f"Failed to fetch weather stats: {e}")
+        logger.error("Failed to fetch weather stats: %s", e)
         alert_service = get_alert_service()
         alert_service.send_error_alert(str(e), "weather stats endpoint")
 
-        return jsonify({
-            'success': False,
-            'error': 'Failed to fetch weather statistics',
-            'details': str(e)
-        }), 500
+        return error_response('Failed to fetch weather statistics', e)
 
 
 @weather_bp.route('/chart-data')
 @secure_endpoint
+@cached_response(ttl=60)
 def get_chart_data():
     """Get data formatted for charts"""
     try:
@@ -330,62 +560,67 @@ def get_chart_data():
         hours = validate_hours_param(hours_param)
 
         db_service = get_db_service()
-        weather_data = db_service.get_weather_data(limit=hours * 2)  # Get more data than needed
+        # The trend keeps the newest `hours` readings, which is exactly what the
+        # query returns (newest first)
+        weather_data = db_service.get_weather_data(limit=hours)
 
         chart_data = weather_data.get_temperature_trend(hours)
+        newest = chart_data[-1]['timestamp'] if chart_data else 0
 
-        return jsonify({
+        return tagged_response({
             'success': True,
             'hours': hours,
             'count': len(chart_data),
             'data': chart_data
-        })
+        }, etag=f"{newest}-{len(chart_data)}")
 
     except Exception as e:
-        logger.error(f"Failed to fetch chart data: {e}")
+        logger.error("Failed to fetch chart data: %s", e)
         alert_service = get_alert_service()
         alert_service.send_error_alert(str(e), "chart data endpoint")
 
-        return jsonify({
-            'success': False,
-            'error': 'Failed to fetch chart data',
-            'details': str(e)
-        }), 500
+        return error_response('Failed to fetch chart data', e)
+
+
+# Error bodies never change, so they are serialized once at import
+NOT_FOUND_BODY = orjson.dumps({
+    'success': False,
+    'error': 'Endpoint not found',
+    'available_endpoints': [
+        '/health',
+        '/latest',
+        '/current',
+        '/stats',
+        '/chart-data'
+    ]
+})
+INTERNAL_ERROR_BODY = orjson.dumps({
+    'success': False,
+    'error': 'Internal server error'
+})
 
 
 @weather_bp.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    return jsonify({
-        'success': False,
-        'error': 'Endpoint not found',
-        'available_endpoints': [
-            '/health',
-            '/latest',
-            '/current',
-            '/stats',
-            '/chart-data'
-        ]
-    }), 404
+    return Response(NOT_FOUND_BODY, status=404, mimetype='application/json')
 
 
 @weather_bp.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
-    logger.error(f"Internal server error: {error}")
-    alert_service = AlertService()
+    logger.error("Internal server error: %s", error)
+    alert_service = get_alert_service()
     alert_service.send_error_alert("Internal server error occurred", "API")
 
-    return jsonify({
-        'success': False,
-        'error': 'Internal server error'
-    }), 500
+    return Response(INTERNAL_ERROR_BODY, status=500, mimetype='application/json')
 
 
 # AerisWeather API endpoints
 
 @weather_bp.route('/aeris/montreal')
 @secure_endpoint
+@cached_response(ttl=UPSTREAM_CURRENT_TTL)
 def get_aeris_montreal_weather():
     """Get current Montreal weather data from AerisWeather API"""
     try:
@@ -398,18 +633,15 @@ def get_aeris_montreal_weather():
                 'error': 'Failed to fetch weather data from AerisWeather API. Check API credentials.'
             }), 503
 
-        return jsonify({
+        return conditional_response({
             'success': True,
             'data': weather_summary,
             'source': 'AerisWeather'
-        }), 200
+        }, max_age=UPSTREAM_CURRENT_TTL)
 
     except Exception as e:
-        logger.error(f"Error fetching AerisWeather data: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error fetching AerisWeather data: %s", e)
+        return error_response('Failed to fetch AerisWeather data', e)
 
 
 @weather_bp.route('/aeris/montreal/csv')
@@ -442,19 +674,17 @@ def download_aeris_montreal_csv():
         }), 200
 
     except Exception as e:
-        logger.error(f"Error creating CSV from AerisWeather data: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error creating CSV from AerisWeather data: %s", e)
+        return error_response('Failed to create CSV from AerisWeather data', e)
 
 
 @weather_bp.route('/aeris/locations')
 @secure_endpoint
+@cached_response(ttl=UPSTREAM_CURRENT_TTL)
 def get_aeris_multiple_locations():
     """Get weather data for multiple locations from AerisWeather API"""
     try:
-        locations = request.args.getlist('locations')
+        locations = unique_list_param('locations')
 
         if not locations:
             return jsonify({
@@ -462,10 +692,14 @@ def get_aeris_multiple_locations():
                 'error': 'No locations provided. Use ?locations=montreal,ca&locations=toronto,ca'
             }), 400
 
-        custom_fields = request.args.getlist('fields')
+        too_large = oversize_response(len(locations))
+        if too_large:
+            return too_large
+
+        custom_fields = unique_list_param('fields')
 
         aeris_service = get_aeris_weather_service()
-        df = aeris_service.locations_loop(locations, custom_fields if custom_fields else None)
+        df = aeris_service.locations_loop(locations, custom_fields or None)
 
         if df is None or df.empty:
             return jsonify({
@@ -473,48 +707,47 @@ def get_aeris_multiple_locations():
                 'error': 'No weather data found for the specified locations'
             }), 404
 
-        # Convert DataFrame to dict for JSON response
-        result = df.to_dict('records')
-
         return jsonify({
             'success': True,
-            'data': result,
-            'count': len(result),
+            'data': records_json(df),
+            'count': len(df),
             'source': 'AerisWeather'
         }), 200
 
     except Exception as e:
-        logger.error(f"Error fetching multiple locations from AerisWeather: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error fetching multiple locations from AerisWeather: %s", e)
+        return error_response('Failed to fetch multiple locations from AerisWeather', e)
 
 
 # AerisWeather Historical Data endpoints
 
 @weather_bp.route('/aeris/historical/<date>')
 @secure_endpoint
+@cached_response(ttl=historical_ttl)
 def get_aeris_historical_date(date):
     """Get historical weather data for a specific date from AerisWeather API"""
     try:
         # Parse date
         try:
-            target_date = datetime.strptime(date, '%Y-%m-%d').date()
+            target_date = parse_date_param(date)
         except ValueError:
             return jsonify({
                 'success': False,
                 'error': 'Invalid date format. Use YYYY-MM-DD'
             }), 400
 
-        locations = request.args.getlist('locations')
+        locations = unique_list_param('locations')
         if not locations:
             locations = ['montreal,ca']
 
-        custom_fields = request.args.getlist('fields')
+        too_large = oversize_response(len(locations) * AERIS_HISTORICAL_ROWS_PER_DAY)
+        if too_large:
+            return too_large
+
+        custom_fields = unique_list_param('fields')
 
         aeris_service = get_aeris_weather_service()
-        df = aeris_service.get_historical_weather_date(target_date, locations, custom_fields if custom_fields else None)
+        df = aeris_service.get_historical_weather_date(target_date, locations, custom_fields or None)
 
         if df is None or df.empty:
             return jsonify({
@@ -522,28 +755,25 @@ def get_aeris_historical_date(date):
                 'error': f'No historical data found for date {date}'
             }), 404
 
-        # Convert DataFrame to dict for JSON response
-        result = df.to_dict('records')
-
-        return jsonify({
+        # A past day's observations no longer change: revalidate with
+        # If-None-Match and let shared caches keep it
+        return conditional_response({
             'success': True,
-            'data': result,
+            'data': records_json(df),
             'date': date,
             'locations': locations,
-            'count': len(result),
+            'count': len(df),
             'source': 'AerisWeather'
-        }), 200
+        }, max_age=UPSTREAM_HISTORICAL_TTL if target_date < datetime.now().date() else None)
 
     except Exception as e:
-        logger.error(f"Error fetching historical data for date {date}: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error fetching historical data for date %s: %s", date, e)
+        return error_response('Failed to fetch historical data', e)
 
 
 @weather_bp.route('/aeris/historical')
 @secure_endpoint
+@cached_response(ttl=historical_ttl)
 def get_aeris_historical_range():
     """Get historical weather data for a date range from AerisWeather API"""
     try:
@@ -557,8 +787,8 @@ def get_aeris_historical_range():
             }), 400
 
         try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+            start_date = parse_date_param(start_date_str)
+            end_date = parse_date_param(end_date_str)
         except ValueError:
             return jsonify({
                 'success': False,
@@ -571,14 +801,19 @@ def get_aeris_historical_range():
                 'error': 'start_date must be before or equal to end_date'
             }), 400
 
-        locations = request.args.getlist('locations')
+        locations = unique_list_param('locations')
         if not locations:
             locations = ['montreal,ca']
 
-        custom_fields = request.args.getlist('fields')
+        days = (end_date - start_date).days + 1
+        too_large = oversize_response(days * len(locations) * AERIS_HISTORICAL_ROWS_PER_DAY)
+        if too_large:
+            return too_large
+
+        custom_fields = unique_list_param('fields')
 
         aeris_service = get_aeris_weather_service()
-        results = aeris_service.get_historical_weather_range(start_date, end_date, locations, custom_fields if custom_fields else None)
+        results = aeris_service.get_historical_weather_range(start_date, end_date, locations, custom_fields or None)
 
         if results is None or len(results) == 0:
             return jsonify({
@@ -588,7 +823,7 @@ def get_aeris_historical_range():
 
         return jsonify({
             'success': True,
-            'data': results,
+            'data': {date_str: records_json(df) for date_str, df in results.items()},
             'date_range': {
                 'start': start_date_str,
                 'end': end_date_str
@@ -599,11 +834,8 @@ def get_aeris_historical_range():
         }), 200
 
     except Exception as e:
-        logger.error(f"Error fetching historical data range: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error fetching historical data range: %s", e)
+        return error_response('Failed to fetch historical data range', e)
 
 
 @weather_bp.route('/aeris/historical/csv')
@@ -621,8 +853,8 @@ def generate_aeris_historical_csvs():
             }), 400
 
         try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+            start_date = parse_date_param(start_date_str)
+            end_date = parse_date_param(end_date_str)
         except ValueError:
             return jsonify({
                 'success': False,
@@ -643,17 +875,17 @@ def generate_aeris_historical_csvs():
                 'error': 'Date range cannot exceed 30 days'
             }), 400
 
-        locations = request.args.getlist('locations')
+        locations = unique_list_param('locations')
         if not locations:
             locations = ['montreal,ca']
 
-        custom_fields = request.args.getlist('fields')
+        custom_fields = unique_list_param('fields')
 
         # Create date range
-        dt_list = pd.date_range(start=start_date, end=end_date, freq='D')
+        dt_list = [start_date + timedelta(days=offset) for offset in range(date_range_days)]
 
         aeris_service = get_aeris_weather_service()
-        generated_files = aeris_service.generate_historical_csvs(dt_list, locations, custom_fields=custom_fields if custom_fields else None)
+        generated_files = aeris_service.generate_historical_csvs(dt_list, locations, custom_fields=custom_fields or None)
 
         if not generated_files:
             return jsonify({
@@ -675,17 +907,15 @@ def generate_aeris_historical_csvs():
         }), 200
 
     except Exception as e:
-        logger.error(f"Error generating historical CSV files: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error generating historical CSV files: %s", e)
+        return error_response('Failed to generate historical CSV files', e)
 
 
 # Open-Meteo API endpoints (Melhor opção para monitoramento semi-real)
 
 @weather_bp.route('/openmeteo/current')
 @secure_endpoint
+@cached_response(ttl=UPSTREAM_CURRENT_TTL)
 def get_openmeteo_current():
     """Get current weather data from Open-Meteo API (best for real-time monitoring)"""
     try:
@@ -698,28 +928,25 @@ def get_openmeteo_current():
                 'error': 'Failed to fetch current weather data from Open-Meteo'
             }), 503
 
-        return jsonify({
+        return conditional_response({
             'success': True,
             'data': weather_data,
             'source': 'Open-Meteo',
             'note': 'Best API for real-time Montreal monitoring (no API key required)'
-        }), 200
+        }, max_age=UPSTREAM_CURRENT_TTL)
 
     except Exception as e:
-        logger.error(f"Error fetching Open-Meteo current weather: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error fetching Open-Meteo current weather: %s", e)
+        return error_response('Failed to fetch Open-Meteo current weather', e)
 
 
 @weather_bp.route('/openmeteo/forecast')
 @secure_endpoint
+@cached_response(ttl=UPSTREAM_FORECAST_TTL)
 def get_openmeteo_forecast():
     """Get weather forecast from Open-Meteo API"""
     try:
-        days = request.args.get('days', default=7, type=int)
-        days = min(max(days, 1), 16)  # Limit between 1 and 16 days
+        days = clamped_int_param('days', default=7, min_val=1, max_val=16)
 
         openmeteo_service = get_open_meteo_service()
         forecast_data = openmeteo_service.get_forecast_weather(days)
@@ -738,15 +965,13 @@ def get_openmeteo_forecast():
         }), 200
 
     except Exception as e:
-        logger.error(f"Error fetching Open-Meteo forecast: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error fetching Open-Meteo forecast: %s", e)
+        return error_response('Failed to fetch Open-Meteo forecast', e)
 
 
 @weather_bp.route('/openmeteo/historical')
 @secure_endpoint
+@cached_response(ttl=historical_ttl)
 def get_openmeteo_historical():
     """Get historical weather data from Open-Meteo API"""
     try:
@@ -760,8 +985,8 @@ def get_openmeteo_historical():
             }), 400
 
         try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+            start_date = parse_date_param(start_date_str)
+            end_date = parse_date_param(end_date_str)
         except ValueError:
             return jsonify({
                 'success': False,
@@ -791,36 +1016,57 @@ def get_openmeteo_historical():
                 'error': f'No historical data found for date range {start_date_str} to {end_date_str}'
             }), 404
 
-        # Convert DataFrame to dict for JSON response
-        result = df.to_dict('records')
-
-        return jsonify({
+        # Archive data for a given range rarely changes, so clients can
+        # revalidate with If-None-Match instead of downloading it again
+        return conditional_response({
             'success': True,
-            'data': result,
+            'data': records_json(df),
             'date_range': {
                 'start': start_date_str,
                 'end': end_date_str,
-                'days': len(result)
+                'days': len(df)
             },
             'source': 'Open-Meteo',
             'note': 'Free historical data up to 60 years available'
-        }), 200
+        }, max_age=UPSTREAM_HISTORICAL_TTL if end_date < date.today() else None)
 
     except Exception as e:
-        logger.error(f"Error fetching Open-Meteo historical data: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error fetching Open-Meteo historical data: %s", e)
+        return error_response('Failed to fetch Open-Meteo historical data', e)
+
+
+def build_monitoring_summary(df: pd.DataFrame, weeks_back: int) -> Dict[str, Any]:
+    """Build the monitoring summary (temperature and precipitation) from daily data"""
+    stats = summarize(df, ['temperature_mean', 'temperature_max', 'temperature_min', 'precipitation'],
+                      aggregations=('mean', 'max', 'min', 'std', 'sum'))
+    precipitation = df['precipitation'] if 'precipitation' in df else pd.Series(dtype=float)
+
+    return {
+        'period_weeks': weeks_back,
+        'total_records': len(df),
+        'temperature': {
+            'max': stats.get('temperature_max', {}).get('max'),
+            'min': stats.get('temperature_min', {}).get('min'),
+            'mean': stats.get('temperature_mean', {}).get('mean'),
+            'std': stats.get('temperature_mean', {}).get('std')
+        },
+        'precipitation': {
+            'total': stats.get('precipitation', {}).get('sum'),
+            'days_with_rain': int((precipitation > 0).sum()),
+            'mean_daily': stats.get('precipitation', {}).get('mean')
+        },
+        'location': 'Montreal, CA',
+        'source': 'Open-Meteo'
+    }
 
 
 @weather_bp.route('/openmeteo/monitoring')
 @secure_endpoint
+@cached_response(ttl=UPSTREAM_FORECAST_TTL)
 def get_openmeteo_monitoring():
     """Get weekly monitoring data (3-4 times per week) from Open-Meteo API"""
     try:
-        weeks_back = request.args.get('weeks', default=4, type=int)
-        weeks_back = min(max(weeks_back, 1), 52)  # Limit between 1 and 52 weeks
+        weeks_back = clamped_int_param('weeks', default=4, min_val=1, max_val=52)
 
         openmeteo_service = get_open_meteo_service()
         df = openmeteo_service.get_weekly_monitoring_data(weeks_back)
@@ -831,35 +1077,36 @@ def get_openmeteo_monitoring():
                 'error': f'No monitoring data found for {weeks_back} weeks back'
             }), 404
 
-        # Convert DataFrame to dict for JSON response
-        result = df.to_dict('records')
-
-        # Generate summary
-        summary = openmeteo_service.get_monitoring_summary(weeks_back)
+        # Summarize the rows already in hand instead of fetching them again
+        summary = build_monitoring_summary(df, weeks_back)
 
         return jsonify({
             'success': True,
-            'data': result,
+            'data': records_json(df),
             'summary': summary,
             'monitoring_schedule': '3 times per week (Mon, Wed, Fri)',
             'weeks_back': weeks_back,
-            'total_records': len(result),
+            'total_records': len(df),
             'source': 'Open-Meteo',
             'note': 'Optimized for semi-real monitoring (3-4 times per week)'
         }), 200
 
     except Exception as e:
-        logger.error(f"Error fetching Open-Meteo monitoring data: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error fetching Open-Meteo monitoring data: %s", e)
+        return error_response('Failed to fetch Open-Meteo monitoring data', e)
+
+
+# Hard limits for the streamed CSV: the range is split into windows the
+# Open-Meteo service accepts and each one is fetched only when the client
+# has consumed the previous
+MAX_CSV_RANGE_DAYS = 3653
+CSV_WINDOW_DAYS = 365
 
 
 @weather_bp.route('/openmeteo/historical/csv')
 @secure_endpoint
 def generate_openmeteo_historical_csv():
-    """Generate CSV file with historical weather data from Open-Meteo"""
+    """Stream historical weather data from Open-Meteo as a CSV download"""
     try:
         start_date_str = request.args.get('start_date')
         end_date_str = request.args.get('end_date')
@@ -871,8 +1118,8 @@ def generate_openmeteo_historical_csv():
             }), 400
 
         try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+            start_date = parse_date_param(start_date_str)
+            end_date = parse_date_param(end_date_str)
         except ValueError:
             return jsonify({
                 'success': False,
@@ -885,52 +1132,194 @@ def generate_openmeteo_historical_csv():
                 'error': 'start_date must be before or equal to end_date'
             }), 400
 
+        if (end_date - start_date).days > MAX_CSV_RANGE_DAYS:
+            return jsonify({
+                'success': False,
+                'error': 'Date range cannot exceed 10 years'
+            }), 400
+
         openmeteo_service = get_open_meteo_service()
-        df = openmeteo_service.get_historical_weather(start_date, end_date)
 
-        if df is None or df.empty:
+        windows = []
+        window_start = start_date
+        while window_start <= end_date:
+            window_end = min(window_start + timedelta(days=CSV_WINDOW_DAYS - 1), end_date)
+            windows.append((window_start, window_end))
+            window_start = window_end + timedelta(days=1)
+
+        # The first window is fetched up front so an empty result can still
+        # be reported with a proper status code
+        first_df = openmeteo_service.get_historical_weather(*windows[0])
+
+        if first_df is None or first_df.empty:
             return jsonify({
                 'success': False,
                 'error': 'No data available for CSV generation'
             }), 404
 
-        csv_path = openmeteo_service.save_to_csv(df)
+        def generate():
+            yield first_df.to_csv(index=False)
+            for window in windows[1:]:
+                df = openmeteo_service.get_historical_weather(*window)
+                if df is None or df.empty:
+                    logger.warning("No Open-Meteo data for %s - %s, stopping CSV stream", window[0], window[1])
+                    return
+                yield df.to_csv(index=False, header=False)
+
+        filename = f"openmeteo_historical_{start_date_str}_{end_date_str}.csv"
+        return Response(
+            stream_with_context(generate()),
+            mimetype='text/csv',
+            headers={'Content-Disposition': f'attachment; filename={filename}'}
+        )
 
-        if csv_path is None:
+    except Exception as e:
+        logger.error("Error generating Open-Meteo historical CSV: %s", e)
+        return error_response('Failed to generate Open-Meteo historical CSV', e)
+
+
+def _batch_current(service: OpenMeteoService, params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    """Batch op: current conditions"""
+    data = service.get_current_weather()
+    if data is None:
+        return 503, {'success': False, 'error': 'Failed to fetch current weather data from Open-Meteo'}
+    return 200, {'success': True, 'data': data, 'source': 'Open-Meteo'}
+
+
+def _batch_forecast(service: OpenMeteoService, params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    """Batch op: daily forecast ('days', 1-16)"""
+    days = clamp_int(params.get('days'), default=7, min_val=1, max_val=16)
+    data = service.get_forecast_weather(days)
+    if data is None or len(data) == 0:
+        return 503, {'success': False, 'error': 'Failed to fetch forecast data from Open-Meteo'}
+    return 200, {'success': True, 'data': data, 'days': len(data), 'source': 'Open-Meteo'}
+
+
+def _batch_monitoring(service: OpenMeteoService, params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    """Batch op: weekly monitoring data and summary ('weeks', 1-52)"""
+    weeks_back = clamp_int(params.get('weeks'), default=4, min_val=1, max_val=52)
+    df = service.get_weekly_monitoring_data(weeks_back)
+    if df is None or df.empty:
+        return 404, {'success': False, 'error': f'No monitoring data found for {weeks_back} weeks back'}
+    return 200, {
+        'success': True,
+        'data': records_json(df),
+        'summary': build_monitoring_summary(df, weeks_back),
+        'weeks_back': weeks_back,
+        'total_records': len(df),
+        'source': 'Open-Meteo'
+    }
+
+
+def _batch_historical(service: OpenMeteoService, params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    """Batch op: archive data ('start_date'/'end_date', at most 365 days)"""
+    try:
+        start_date = parse_date_param(params.get('start_date'))
+        end_date = parse_date_param(params.get('end_date'))
+    except (TypeError, ValueError):
+        return 400, {'success': False, 'error': 'start_date and end_date are required (format: YYYY-MM-DD)'}
+    if start_date > end_date:
+        return 400, {'success': False, 'error': 'start_date must be before or equal to end_date'}
+    if (end_date - start_date).days > 365:
+        return 400, {'success': False, 'error': 'Date range cannot exceed 365 days for Open-Meteo API'}
+
+    df = service.get_historical_weather(start_date, end_date)
+    if df is None or df.empty:
+        return 404, {'success': False, 'error': 'No historical data found for the requested date range'}
+    return 200, {
+        'success': True,
+        'data': records_json(df),
+        'date_range': {'start': start_date.isoformat(), 'end': end_date.isoformat(), 'days': len(df)},
+        'source': 'Open-Meteo'
+    }
+
+
+# Sub-requests accepted by the batch endpoint: op -> handler(service, params) -> (status, body)
+OPENMETEO_BATCH_OPS = {
+    'current': _batch_current,
+    'forecast': _batch_forecast,
+    'monitoring': _batch_monitoring,
+    'historical': _batch_historical,
+}
+MAX_BATCH_REQUESTS = 10
+
+
+def _run_batch_op(service: OpenMeteoService, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one batch sub-request against the Open-Meteo service"""
+    op = params['op']
+    try:
+        status, body = OPENMETEO_BATCH_OPS[op](service, params)
+    except Exception as e:
+        # Runs outside the request context: log the details, return a generic error
+        logger.error("Error running Open-Meteo batch op %s: %s", op, e)
+        status, body = 500, {'success': False, 'error': 'Batch operation failed'}
+    return {'op': op, 'status': status, 'body': body}
+
+
+@weather_bp.route('/openmeteo/batch', methods=['POST'])
+@secure_endpoint
+def openmeteo_batch():
+    """Run several Open-Meteo requests concurrently in a single round-trip"""
+    try:
+        payload = request.get_json(silent=True) or {}
+        sub_requests = payload.get('requests')
+
+        if not isinstance(sub_requests, list) or not sub_requests:
             return jsonify({
                 'success': False,
-                'error': 'Failed to save CSV file'
-            }), 500
+                'error': 'Body must be {"requests": [{"op": "current"}, {"op": "forecast", "days": 7}, ...]}'
+            }), 400
+
+        if len(sub_requests) > MAX_BATCH_REQUESTS:
+            return jsonify({
+                'success': False,
+                'error': f'A batch cannot contain more than {MAX_BATCH_REQUESTS} requests'
+            }), 400
+
+        # A non-string op (list, dict) would be unhashable in the membership test
+        invalid_ops = [item.get('op') if isinstance(item, dict) else item
+                       for item in sub_requests
+                       if not isinstance(item, dict) or not isinstance(item.get('op'), str)
+                       or item['op'] not in OPENMETEO_BATCH_OPS]
+        if invalid_ops:
+            return jsonify({
+                'success': False,
+                'error': f'Unknown batch operations: {invalid_ops}',
+                'available_ops': list(OPENMETEO_BATCH_OPS)
+            }), 400
+
+        # Each op is an upstream call: charge the ones beyond the first, which
+        # secure_endpoint already counted
+        rate_limit_response = check_rate_limit(cost=len(sub_requests) - 1) if len(sub_requests) > 1 else None
+        if rate_limit_response:
+            return rate_limit_response
+
+        openmeteo_service = get_open_meteo_service()
+        with ThreadPoolExecutor(max_workers=len(sub_requests)) as executor:
+            futures = [executor.submit(_run_batch_op, openmeteo_service, item) for item in sub_requests]
+            results = [future.result() for future in futures]
 
         return jsonify({
             'success': True,
-            'message': 'Open-Meteo historical CSV generated successfully',
-            'file_path': csv_path,
-            'date_range': {
-                'start': start_date_str,
-                'end': end_date_str,
-                'days': len(df)
-            },
+            'count': len(results),
+            'results': results,
             'source': 'Open-Meteo'
         }), 200
 
     except Exception as e:
-        logger.error(f"Error generating Open-Meteo historical CSV: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error running Open-Meteo batch: %s", e)
+        return error_response('Failed to run Open-Meteo batch', e)
 
 
 # Long-term monitoring endpoints (2024-2026)
 
 @weather_bp.route('/openmeteo/long-term')
 @secure_endpoint
+@cached_response(ttl=UPSTREAM_FORECAST_TTL)
 def get_openmeteo_long_term():
     """Get long-term monitoring data (2024-2026)"""
     try:
-        years = request.args.get('years', default=2, type=int)
-        years = min(max(years, 1), 3)  # Limit to 1-3 years
+        years = clamped_int_param('years', default=2, min_val=1, max_val=3)
 
         openmeteo_service = get_open_meteo_service()
         df = openmeteo_service.get_long_term_monitoring_data(years)
@@ -941,35 +1330,29 @@ def get_openmeteo_long_term():
                 'error': f'No long-term monitoring data found for {years} years'
             }), 404
 
-        # Convert DataFrame to dict for JSON response
-        result = df.to_dict('records')
-
         return jsonify({
             'success': True,
-            'data': result,
+            'data': records_json(df),
             'period': f'2024-{2024 + years - 1}',
             'years': years,
-            'total_records': len(result),
+            'total_records': len(df),
             'monitoring_frequency': '3 times per week (Mon, Wed, Fri)',
             'source': 'Open-Meteo',
             'note': 'Long-term climate monitoring data for Montreal'
         }), 200
 
     except Exception as e:
-        logger.error(f"Error fetching long-term monitoring data: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error fetching long-term monitoring data: %s", e)
+        return error_response('Failed to fetch long-term monitoring data', e)
 
 
 @weather_bp.route('/openmeteo/seasonal-analysis')
 @secure_endpoint
+@cached_response(ttl=UPSTREAM_FORECAST_TTL)
 def get_openmeteo_seasonal_analysis():
     """Get seasonal analysis of climate data"""
     try:
-        years = request.args.get('years', default=2, type=int)
-        years = min(max(years, 1), 3)  # Limit to 1-3 years
+        years = clamped_int_param('years', default=2, min_val=1, max_val=3)
 
         openmeteo_service = get_open_meteo_service()
         seasonal_data = openmeteo_service.get_seasonal_analysis(years)
@@ -991,20 +1374,17 @@ def get_openmeteo_seasonal_analysis():
         }), 200
 
     except Exception as e:
-        logger.error(f"Error fetching seasonal analysis: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error fetching seasonal analysis: %s", e)
+        return error_response('Failed to fetch seasonal analysis', e)
 
 
 @weather_bp.route('/openmeteo/yearly-trends')
 @secure_endpoint
+@cached_response(ttl=UPSTREAM_FORECAST_TTL)
 def get_openmeteo_yearly_trends():
     """Get yearly trends analysis"""
     try:
-        years = request.args.get('years', default=2, type=int)
-        years = min(max(years, 1), 3)  # Limit to 1-3 years
+        years = clamped_int_param('years', default=2, min_val=1, max_val=3)
 
         openmeteo_service = get_open_meteo_service()
         yearly_data = openmeteo_service.get_yearly_trends(years)
@@ -1026,35 +1406,40 @@ def get_openmeteo_yearly_trends():
         }), 200
 
     except Exception as e:
-        logger.error(f"Error fetching yearly trends: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error fetching yearly trends: %s", e)
+        return error_response('Failed to fetch yearly trends', e)
+
+
+MONITORING_DAYS = (0, 2, 4)  # Mon, Wed, Fri
+# Days from each weekday to the next monitoring day (0 when it is one)
+NEXT_MONITORING_OFFSET = tuple(min((day - weekday) % 7 for day in MONITORING_DAYS) for weekday in range(7))
+
+
+@functools.lru_cache(maxsize=1)
+def monitoring_schedule(today: date) -> Tuple[int, float, bool, str]:
+    """Date-derived monitoring status, computed once per day"""
+    current_year = today.year
+
+    # Calculate monitoring progress
+    total_years = 3  # 2024-2026
+    years_completed = current_year - 2024
+    progress_percentage = min(100, max(0, (years_completed / total_years) * 100))
+
+    # Next monitoring day (today if it is one)
+    offset = NEXT_MONITORING_OFFSET[today.weekday()]
+    next_monitoring = today + timedelta(days=offset)
+
+    return current_year, progress_percentage, offset == 0, next_monitoring.isoformat()
 
 
 @weather_bp.route('/monitoring/status')
 @require_auth
 @secure_endpoint
+@no_store
 def get_monitoring_status():
     """Get current monitoring system status"""
     try:
-        today = datetime.now().date()
-        current_year = today.year
-
-        # Calculate monitoring progress
-        total_years = 3  # 2024-2026
-        years_completed = current_year - 2024
-        progress_percentage = min(100, max(0, (years_completed / total_years) * 100))
-
-        # Check if today is a monitoring day
-        monitoring_days = [0, 2, 4]  # Mon, Wed, Fri
-        is_monitoring_day = today.weekday() in monitoring_days
-
-        # Get next monitoring date
-        next_monitoring = today
-        while next_monitoring.weekday() not in monitoring_days:
-            next_monitoring += timedelta(days=1)
+        current_year, progress_percentage, is_monitoring_day, next_monitoring = monitoring_schedule(date.today())
 
         status_info = {
             'system_status': 'active',
@@ -1065,7 +1450,7 @@ def get_monitoring_status():
             'monitoring_frequency': '3 times per week',
             'monitoring_days': ['Monday', 'Wednesday', 'Friday'],
             'is_monitoring_day_today': is_monitoring_day,
-            'next_monitoring_date': next_monitoring.strftime('%Y-%m-%d'),
+            'next_monitoring_date': next_monitoring,
             'data_sources': ['Open-Meteo (Primary)', 'AerisWeather (Backup)'],
             'last_updated': datetime.now().isoformat(),
             'reports_generated': 'Monthly and yearly climate reports',
@@ -1079,11 +1464,8 @@ def get_monitoring_status():
         }), 200
 
     except Exception as e:
-        logger.error(f"Error getting monitoring status: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error getting monitoring status: %s", e)
+        return error_response('Failed to get monitoring status', e)
 
 
 
@@ -1121,11 +1503,8 @@ def get_weatherapi_current():
             }), 503
 
     except Exception as e:
-        logger.error(f"Error fetching WeatherAPI current weather: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error fetching WeatherAPI current weather: %s", e)
+        return error_response('Failed to fetch WeatherAPI current weather', e)
 
 
 @weather_bp.route('/weatherapi/forecast')
@@ -1133,8 +1512,7 @@ def get_weatherapi_current():
 def get_weatherapi_forecast():
     """Get forecast from WeatherAPI"""
     try:
-        days = request.args.get('days', default=7, type=int)
-        days = min(max(days, 1), 10)  # WeatherAPI supports up to 10 days
+        days = clamped_int_param('days', default=7, min_val=1, max_val=10)  # WeatherAPI supports up to 10 days
 
         weatherapi_service = get_weatherapi_service()
         data = weatherapi_service.get_forecast_weather(days)
@@ -1155,11 +1533,8 @@ def get_weatherapi_forecast():
             }), 503
 
     except Exception as e:
-        logger.error(f"Error fetching WeatherAPI forecast: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error fetching WeatherAPI forecast: %s", e)
+        return error_response('Failed to fetch WeatherAPI forecast', e)
 
 
 @weather_bp.route('/weatherapi/realtime')
@@ -1186,8 +1561,5 @@ def get_weatherapi_realtime():
             }), 503
 
     except Exception as e:
-        logger.error(f"Error fetching WeatherAPI real-time data: {e}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        logger.error("Error fetching WeatherAPI real-time data: %s", e)
+        return error_response('Failed to fetch WeatherAPI real-time data', e)
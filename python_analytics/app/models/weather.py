@@ -47,7 +47,7 @@ class WeatherData:
             'id': self.id,
             'city': self.city,
             'temperature': round(self.temperature, 1),
-            'feels_like': round(self.feels_like, 1),
+            'feels_like': round(self.feels_like, 1) if self.feels_like is not None else None,
             'humidity': self.humidity,
             'pressure': self.pressure,
             'wind_speed': round(self.wind_speed, 1),
@@ -128,10 +128,11 @@ class WeatherDataList:
         # Filter last N hours (simplified - in real app you'd use proper time filtering)
         recent_data = sorted_data[-min(len(sorted_data), hours):]
 
+        # Sensor precision is 0.1 degree; extra digits only inflate the payload
         return [
             {
                 'timestamp': item.timestamp,
-                'temperature': item.temperature,
+                'temperature': round(item.temperature, 1),
                 'humidity': item.humidity,
                 'created_at': item.created_at.isoformat() if item.created_at else None
             }
@@ -1,20 +1,28 @@
 from flask import Flask, jsonify, render_template
-import pandas as pd
+from sqlalchemy import text
 from .db import engine
 from .alerts import send_alert
 
+LATEST_SQL = text("""
+    SELECT city, temperature, feels_like, humidity, pressure, wind_speed, wind_direction,
+           weather_main, weather_description, weather_icon,
+           to_timestamp(timestamp) as ts, created_at
+    FROM weather_data
+    ORDER BY timestamp DESC LIMIT 100;
+""")
+
+
+def fetch_latest_rows():
+    """Last 100 readings as plain dicts (no DataFrame for a 100-row result)"""
+    with engine.connect() as conn:
+        return [dict(row) for row in conn.execute(LATEST_SQL).mappings()]
+
+
 def create_routes(app: Flask):
     @app.route("/latest")
     def latest():
         try:
-            df = pd.read_sql("""
-                SELECT city, temperature, feels_like, humidity, pressure, wind_speed, wind_direction,
-                       weather_main, weather_description, weather_icon,
-                       to_timestamp(timestamp) as ts, created_at
-                FROM weather_data
-                ORDER BY timestamp DESC LIMIT 100;
-            """, engine)
-            return jsonify(df.to_dict(orient="records"))
+            return jsonify(fetch_latest_rows())
         except Exception as e:
             send_alert(f"Error /latest endpoint: {e}")
             return jsonify({"error": str(e)}), 500
@@ -22,22 +30,16 @@ def create_routes(app: Flask):
     @app.route("/dashboard")
     def dashboard():
         try:
-            df = pd.read_sql("""
-                SELECT city, temperature, feels_like, humidity, pressure, wind_speed, wind_direction,
-                       weather_main, weather_description, weather_icon,
-                       to_timestamp(timestamp) as ts, created_at
-                FROM weather_data
-                ORDER BY timestamp DESC LIMIT 100;
-            """, engine)
+            rows = fetch_latest_rows()
 
             # Current weather data (latest record)
-            latest = df.iloc[0] if not df.empty else None
+            latest = rows[0] if rows else None
 
             # Chart data for temperature and humidity
             chart_data = {
-                'temperature': df[['ts','temperature']].to_dict(orient='records'),
-                'humidity': df[['ts','humidity']].to_dict(orient='records'),
-                'feels_like': df[['ts','feels_like']].to_dict(orient='records') if 'feels_like' in df.columns else []
+                'temperature': [{'ts': row['ts'], 'temperature': row['temperature']} for row in rows],
+                'humidity': [{'ts': row['ts'], 'humidity': row['humidity']} for row in rows],
+                'feels_like': [{'ts': row['ts'], 'feels_like': row['feels_like']} for row in rows]
             }
 
             return render_template("dashboard.html",
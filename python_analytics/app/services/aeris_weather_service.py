@@ -1,16 +1,23 @@
 import json
 import os
-from typing import List, Optional, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, Dict, Tuple, TypeVar
 import pandas as pd
-from pandas import DatetimeIndex
-from requests import request
+import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+R = TypeVar('R')
+
 class AerisWeatherService:
+    # Upper bound on simultaneous requests to the AerisWeather API
+    MAX_CONCURRENCY = 8
+
     def __init__(self):
         self.client_id = os.getenv('AERIS_CLIENT_ID')
         self.client_secret = os.getenv('AERIS_CLIENT_SECRET')
@@ -36,6 +43,11 @@ class AerisWeatherService:
         # Montreal location
         self.montreal_location = "montreal,ca"
 
+        # Shared session so concurrent fetches reuse pooled connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.MAX_CONCURRENCY)
+        self.session.mount("https://", adapter)
+
         # Open-Meteo API configuration
         self.open_meteo_base_url = "https://api.open-meteo.com/v1/forecast"
         self.open_meteo_historical_url = "https://archive-api.open-meteo.com/v1/archive"
@@ -75,7 +87,7 @@ class AerisWeatherService:
         logger.info(f"Retrieving AerisWeather data for {location}...")
 
         try:
-            res = request(
+            res = self.session.request(
                 method="GET",
                 url=f"https://api.aerisapi.com/conditions/{location}",
                 params={
@@ -123,14 +135,19 @@ class AerisWeatherService:
         """Get current weather data for Montreal"""
         return self.aeris_api_dataframe(self.montreal_location, custom_fields)
 
-    def locations_loop(self, locations: List[str], custom_fields: List[str] = None) -> Optional[pd.DataFrame]:
-        """Fetch weather data for multiple locations"""
-        all_dataframes = []
+    def _fetch_concurrently(self, fetch: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """Run fetch over items on a bounded thread pool, keeping the input order"""
+        items = list(items)
+        if len(items) <= 1:
+            return [fetch(item) for item in items]
 
-        for location in locations:
-            df = self.aeris_api_dataframe(location, custom_fields)
-            if df is not None:
-                all_dataframes.append(df)
+        with ThreadPoolExecutor(max_workers=min(len(items), self.MAX_CONCURRENCY)) as executor:
+            return list(executor.map(fetch, items))
+
+    def locations_loop(self, locations: List[str], custom_fields: List[str] = None) -> Optional[pd.DataFrame]:
+        """Fetch weather data for multiple locations concurrently"""
+        results = self._fetch_concurrently(lambda location: self.aeris_api_dataframe(location, custom_fields), locations)
+        all_dataframes = [df for df in results if df is not None]
 
         if all_dataframes:
             combined_df = pd.concat(all_dataframes, ignore_index=True)
@@ -175,7 +192,7 @@ class AerisWeatherService:
         logger.info(f"Retrieving historical AerisWeather data for {location} on {from_date.strftime('%Y-%m-%d')}...")
 
         try:
-            res = request(
+            res = self.session.request(
                 method="GET",
                 url=f"https://api.aerisapi.com/conditions/{location}",
                 params={
@@ -224,39 +241,40 @@ class AerisWeatherService:
 
     def get_historical_weather_date(self, target_date: date, locations: List[str] = None, custom_fields: List[str] = None) -> Optional[pd.DataFrame]:
         """Get historical weather data for a specific date across multiple locations"""
+        return self._historical_by_date([target_date], locations, custom_fields)[target_date]
+
+    def _historical_by_date(self, dates: List[date], locations: List[str] = None, custom_fields: List[str] = None) -> Dict[date, Optional[pd.DataFrame]]:
+        """Fetch every (date, location) pair on one pool and combine the locations per date"""
         if locations is None:
             locations = [self.montreal_location]
 
-        all_dataframes = []
+        pairs = [(day, location) for day in dates for location in locations]
+        frames = self._fetch_concurrently(
+            lambda pair: self.aeris_api_dataframe_historical(pair[1], pair[0], custom_fields), pairs)
 
-        for location in locations:
-            df = self.aeris_api_dataframe_historical(location, target_date, custom_fields)
+        per_date: Dict[date, List[pd.DataFrame]] = {day: [] for day in dates}
+        for (day, _), df in zip(pairs, frames):
             if df is not None:
-                all_dataframes.append(df)
-
-        if all_dataframes:
-            combined_df = pd.concat(all_dataframes, ignore_index=True)
-            logger.info(f"Successfully combined historical data for {len(all_dataframes)} locations on {target_date.strftime('%Y-%m-%d')}")
-            return combined_df
-        else:
-            logger.warning(f"No historical data retrieved for any locations on {target_date.strftime('%Y-%m-%d')}")
-            return None
+                per_date[day].append(df)
+
+        combined = {}
+        for day, all_dataframes in per_date.items():
+            if all_dataframes:
+                combined[day] = pd.concat(all_dataframes, ignore_index=True)
+                logger.info(f"Successfully combined historical data for {len(all_dataframes)} locations on {day.strftime('%Y-%m-%d')}")
+            else:
+                combined[day] = None
+                logger.warning(f"No historical data retrieved for any locations on {day.strftime('%Y-%m-%d')}")
+        return combined
 
     def get_historical_weather_range(self, start_date: date, end_date: date, locations: List[str] = None, custom_fields: List[str] = None) -> Optional[Dict[str, pd.DataFrame]]:
         """Get historical weather data for a date range across multiple locations"""
-        if locations is None:
-            locations = [self.montreal_location]
-
         # Create date range
-        date_range = pd.date_range(start=start_date, end=end_date, freq='D')
+        dates = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
 
-        results = {}
-
-        for current_date in date_range:
-            date_str = current_date.strftime('%Y-%m-%d')
-            df = self.get_historical_weather_date(current_date.date(), locations, custom_fields)
-            if df is not None:
-                results[date_str] = df
+        # All dates and locations are fetched concurrently
+        frames = self._historical_by_date(dates, locations, custom_fields)
+        results = {day.strftime('%Y-%m-%d'): df for day, df in frames.items() if df is not None}
 
         if results:
             logger.info(f"Successfully retrieved historical data for {len(results)} dates")
@@ -265,21 +283,23 @@ class AerisWeatherService:
             logger.warning("No historical data retrieved for the specified date range")
             return None
 
-    def generate_historical_csvs(self, date_range: DatetimeIndex, locations: List[str] = None, output_dir: str = "csv_output", custom_fields: List[str] = None) -> List[str]:
+    def generate_historical_csvs(self, dates: Iterable[date], locations: List[str] = None, output_dir: str = "csv_output", custom_fields: List[str] = None) -> List[str]:
         """Generate CSV files for historical weather data across a date range"""
         try:
             output_path = Path(output_dir)
             output_path.mkdir(exist_ok=True)
 
-            sorted_dates = date_range.sort_values()
+            sorted_dates = sorted(dates)
             generated_files = []
 
+            # Fetch all dates concurrently, then write the files in date order
+            frames = self._historical_by_date(sorted_dates, locations, custom_fields)
+
             for current_date in sorted_dates:
                 filename = f"aeris-historical-conditions-{current_date.strftime('%Y%m%d')}.csv"
                 file_path = output_path / filename
 
-                # Get data for this date
-                df = self.get_historical_weather_date(current_date.date(), locations, custom_fields)
+                df = frames[current_date]
 
                 if df is not None:
                     df.to_csv(file_path, encoding="utf-8", index=False)
@@ -1,14 +1,35 @@
 import logging
+import queue
+import threading
 import requests
 import os
 from typing import Optional
 from datetime import datetime
 
+from ..utils.cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 
 class AlertService:
-    """Service for sending alerts via Telegram"""
+    """Service for sending alerts via Telegram
+
+    Alerts are queued and delivered by a single background thread, so callers
+    (typically request error handlers) never wait on api.telegram.org.
+    """
+
+    QUEUE_MAXSIZE = 256
+    REQUEST_TIMEOUT = 10
+    # The same error (context + message) is alerted at most once per window
+    ERROR_ALERT_WINDOW = 300
+
+    # Class-level state shared by every AlertService instance (and app.alerts):
+    # one queue, one delivery thread and one duplicate-error window per process
+    _queue: "queue.Queue" = queue.Queue(maxsize=QUEUE_MAXSIZE)
+    _worker: Optional[threading.Thread] = None
+    _worker_lock = threading.Lock()
+    _session = requests.Session()
+    _recent_errors = TTLCache(ttl=ERROR_ALERT_WINDOW, maxsize=256)
 
     def __init__(self):
         self.telegram_token: Optional[str] = os.getenv('TELEGRAM_TOKEN')
@@ -20,44 +41,84 @@ class AlertService:
         else:
             logger.info("Telegram alerts disabled (missing TELEGRAM_TOKEN or TELEGRAM_CHAT_ID)")
 
+    @classmethod
+    def _ensure_worker(cls):
+        """Start the delivery thread on first use (after gunicorn has forked)"""
+        if cls._worker is not None and cls._worker.is_alive():
+            return
+        with cls._worker_lock:
+            if cls._worker is None or not cls._worker.is_alive():
+                cls._worker = threading.Thread(target=cls._drain_queue, name="telegram-alerts", daemon=True)
+                cls._worker.start()
+
+    @classmethod
+    def _drain_queue(cls):
+        """Deliver queued alerts one at a time"""
+        while True:
+            url, payload, level = cls._queue.get()
+            try:
+                response = cls._session.post(url, json=payload, timeout=cls.REQUEST_TIMEOUT)
+                if response.status_code == 200:
+                    logger.info(f"Alert sent successfully: {level}")
+                else:
+                    logger.error(f"Failed to send alert: {response.status_code} - {response.text}")
+            except Exception as e:
+                logger.error(f"Error sending alert: {e}")
+            finally:
+                cls._queue.task_done()
+
+    @classmethod
+    def enqueue(cls, url: str, payload: dict, level: str = "INFO") -> bool:
+        """Hand a ready-made Telegram request to the delivery thread
+
+        Returns False if the queue is full and the alert was dropped.
+        """
+        cls._ensure_worker()
+        try:
+            cls._queue.put_nowait((url, payload, level))
+            return True
+        except queue.Full:
+            return False
+
     def send_alert(self, message: str, level: str = "INFO") -> bool:
-        """Send alert message via Telegram"""
+        """Queue alert message for delivery via Telegram
+
+        Returns True if the alert was queued, False if alerts are disabled or
+        the queue is full.
+        """
         if not self.enabled:
             logger.debug(f"Alert not sent (disabled): {message}")
             return False
 
-        try:
-            emoji = {
-                "ERROR": "🚨",
-                "WARNING": "⚠️",
-                "INFO": "ℹ️",
-                "SUCCESS": "✅"
-            }.get(level.upper(), "📢")
-
-            full_message = f"{emoji} Weather Dashboard Alert\n\n{message}\n\n🕐 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-
-            url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
-            payload = {
-                "chat_id": self.telegram_chat_id,
-                "text": full_message,
-                "parse_mode": "HTML"
-            }
-
-            response = requests.post(url, json=payload, timeout=10)
-
-            if response.status_code == 200:
-                logger.info(f"Alert sent successfully: {level}")
-                return True
-            else:
-                logger.error(f"Failed to send alert: {response.status_code} - {response.text}")
-                return False
-
-        except Exception as e:
-            logger.error(f"Error sending alert: {e}")
-            return False
+        emoji = {
+            "ERROR": "🚨",
+            "WARNING": "⚠️",
+            "INFO": "ℹ️",
+            "SUCCESS": "✅"
+        }.get(level.upper(), "📢")
+
+        full_message = f"{emoji} Weather Dashboard Alert\n\n{message}\n\n🕐 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+
+        url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
+        payload = {
+            "chat_id": self.telegram_chat_id,
+            "text": full_message,
+            "parse_mode": "HTML"
+        }
+
+        if self.enqueue(url, payload, level):
+            return True
+        logger.warning(f"Alert queue full, dropping {level} alert: {message}")
+        return False
 
     def send_error_alert(self, error_message: str, context: str = ""):
-        """Send error alert"""
+        """Send error alert, skipping repeats of the same error within ERROR_ALERT_WINDOW"""
+        signature = (context, error_message)
+        if self._recent_errors.get(signature):
+            logger.debug(f"Duplicate error alert suppressed: {context}")
+            return
+        self._recent_errors.set(signature, True)
+
         message = f"❌ Error in {context}\n\n{error_message}"
         self.send_alert(message, "ERROR")
 
@@ -69,6 +130,3 @@ class AlertService:
         """Send weather-related alert"""
         message = f"🌤️ Weather Update for {city}\n\nCurrent condition: {condition}\nTemperature: {temperature:.1f}°C"
         self.send_alert(message, "INFO")
-
-
-
@@ -1,7 +1,6 @@
 import logging
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 from contextlib import contextmanager
-import pandas as pd
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 
@@ -13,26 +12,29 @@ logger = logging.getLogger(__name__)
 class DatabaseService:
     """Service for database operations"""
 
+    # Pool per gunicorn worker; keep workers * (POOL_SIZE + MAX_OVERFLOW)
+    # below Postgres max_connections
+    POOL_SIZE = 10
+    MAX_OVERFLOW = 5
+    POOL_RECYCLE = 1800
+
     def __init__(self, connection_string: str):
-        logger.info(f"DatabaseService init - received: {connection_string}")
-        logger.info(f"Type: {type(connection_string)}")
         self.connection_string = str(connection_string)  # Ensure it's a string
-        logger.info(f"After conversion: {self.connection_string}")
         self._engine: Optional[Engine] = None
 
     @property
     def engine(self) -> Engine:
-        """Lazy-loaded database engine"""
+        """Lazy-loaded pooled database engine"""
         if self._engine is None:
-            logger.info(f"Creating engine with connection string: {self.connection_string}")
-            logger.info(f"Connection string type: {type(self.connection_string)}")
             self._engine = create_engine(
                 self.connection_string,
+                pool_size=self.POOL_SIZE,
+                max_overflow=self.MAX_OVERFLOW,
                 pool_pre_ping=True,
-                pool_recycle=300,
+                pool_recycle=self.POOL_RECYCLE,
                 echo=False
             )
-            logger.info("Database connection established")
+            logger.info("Database connection pool created")
         return self._engine
 
     @contextmanager
@@ -53,14 +55,14 @@ class DatabaseService:
                        weather_icon, timestamp, timezone, created_at
                 FROM weather_data
                 ORDER BY timestamp DESC
-                LIMIT %s
-            """ % limit
-
-            df = pd.read_sql(query, self.engine)
+                LIMIT :limit
+            """
 
-            weather_data = []
-            for _, row in df.iterrows():
-                weather_data.append(WeatherData.from_db_row(row))
+            # A few hundred rows at most: build the models straight from the
+            # driver rows instead of going through a DataFrame
+            with self.get_connection() as conn:
+                result = conn.execute(text(query), {'limit': int(limit)})
+                weather_data = [WeatherData.from_db_row(row) for row in result]
 
             logger.info(f"Retrieved {len(weather_data)} weather records")
             return WeatherDataList(weather_data)
@@ -69,6 +71,48 @@ class DatabaseService:
             logger.error(f"Failed to fetch weather data: {e}")
             raise
 
+    def iter_weather_data(self, limit: int = 100, batch_size: int = 200) -> Iterator[WeatherData]:
+        """Yield the newest weather rows one at a time
+
+        Uses a server-side cursor, so Postgres sends rows in batches instead
+        of the driver buffering the whole result set.
+        """
+        query = """
+            SELECT id, city, temperature, feels_like, humidity, pressure,
+                   wind_speed, wind_direction, weather_main, weather_description,
+                   weather_icon, timestamp, timezone, created_at
+            FROM weather_data
+            ORDER BY timestamp DESC
+            LIMIT :limit
+        """
+
+        with self.get_connection() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(
+                text(query), {'limit': int(limit)})
+            for row in result:
+                yield WeatherData.from_db_row(row)
+
+    def get_latest_weather(self) -> Optional[WeatherData]:
+        """Fetch the most recent weather reading (single row, no DataFrame)"""
+        try:
+            query = """
+                SELECT id, city, temperature, feels_like, humidity, pressure,
+                       wind_speed, wind_direction, weather_main, weather_description,
+                       weather_icon, timestamp, timezone, created_at
+                FROM weather_data
+                ORDER BY timestamp DESC
+                LIMIT 1
+            """
+
+            with self.get_connection() as conn:
+                row = conn.execute(text(query)).fetchone()
+
+            return WeatherData.from_db_row(row) if row else None
+
+        except Exception as e:
+            logger.error(f"Failed to fetch latest weather: {e}")
+            raise
+
     def get_weather_stats(self) -> WeatherStats:
         """Get weather statistics"""
         try:
@@ -121,15 +165,11 @@ class DatabaseService:
     def health_check(self) -> bool:
         """Check database connectivity"""
         try:
-            logger.info(f"Testing connection to: {self.connection_string}")
-            # Simple connection test
-            conn = self.engine.connect()
-            conn.execute(text("SELECT 1"))
-            conn.close()
-            logger.info("Database health check passed")
+            with self.get_connection() as conn:
+                conn.execute(text("SELECT 1"))
+            logger.debug("Database health check passed")
             return True
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
-            logger.error(f"Connection string type: {type(self.connection_string)}")
             return False
 
@@ -6,6 +6,7 @@ usando a API Open-Meteo (gratuita, sem limites).
 """
 
 from typing import Optional
+import orjson
 import pandas as pd
 from requests import request
 from pathlib import Path
@@ -30,7 +31,7 @@ class OpenMeteoService:
 
     def get_historical_weather(self, start_date: date, end_date: date) -> Optional[pd.DataFrame]:
         """Busca dados históricos de Montreal"""
-        if start_date >= end_date:
+        if start_date > end_date:
             return None
 
         # Limitar a 365 dias para evitar sobrecarga
@@ -50,12 +51,12 @@ class OpenMeteoService:
             response = request("GET", self.historical_url, params=params, timeout=30)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if "daily" in data:
                 daily_data = data["daily"]
                 df_data = {
-                    "date": pd.to_datetime(daily_data["time"]),
+                    "date": pd.to_datetime(daily_data["time"], format="%Y-%m-%d", cache=True),
                     "temperature_max": daily_data.get("temperature_2m_max", []),
                     "temperature_min": daily_data.get("temperature_2m_min", []),
                     "temperature_mean": daily_data.get("temperature_2m_mean", []),
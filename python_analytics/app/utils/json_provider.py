@@ -0,0 +1,30 @@
+from typing import Any, Union
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson"""
+
+    # Responses are compact and keep insertion order, even in debug mode;
+    # sorting and indenting only add work for the large record lists
+    sort_keys = False
+    compact = True
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string"""
+        # Aware UTC datetimes are emitted as RFC 3339 with a 'Z' suffix
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+
+        # Types orjson can't handle natively (Decimal, UUID, pandas
+        # Timestamp...) fall back to Flask's default conversions
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize JSON from a string or bytes"""
+        return orjson.loads(s)
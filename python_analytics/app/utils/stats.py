@@ -0,0 +1,27 @@
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+DEFAULT_AGGREGATIONS = ('mean', 'max', 'min', 'std')
+
+
+def summarize(data: Union[pd.DataFrame, List[Dict[str, Any]]],
+              columns: Iterable[str],
+              aggregations: Iterable[str] = DEFAULT_AGGREGATIONS) -> Dict[str, Dict[str, Optional[float]]]:
+    """Vectorized per-column statistics for a DataFrame or list of records
+
+    Missing values are skipped; columns absent from the data are ignored.
+    """
+    df = data if isinstance(data, pd.DataFrame) else pd.DataFrame.from_records(data)
+    present = [column for column in columns if column in df.columns]
+    if not present:
+        return {}
+
+    stats = df[present].apply(pd.to_numeric, errors='coerce').agg(list(aggregations))
+    return {
+        column: {
+            aggregation: None if pd.isna(value) else round(float(value), 2)
+            for aggregation, value in stats[column].items()
+        }
+        for column in present
+    }
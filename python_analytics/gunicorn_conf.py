@@ -0,0 +1,36 @@
+"""
+Configuração do Gunicorn para o dashboard
+
+Workers gevent: as chamadas bloqueantes de requests (Open-Meteo, Aeris,
+WeatherAPI, Telegram) cedem a vez para outras requisições do mesmo worker.
+O worker gevent aplica o monkey patch antes de carregar a aplicação, por isso
+preload_app fica desligado.
+
+Uso: gunicorn -c gunicorn_conf.py 'app:create_app()'
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('FLASK_PORT', '5000')}"
+
+# 2*CPU+1 é a regra do Gunicorn, mas cpu_count() enxerga os núcleos do host e
+# não o limite do container (1 CPU / 512M em produção), por isso o teto
+worker_class = "gevent"
+workers = int(os.getenv("GUNICORN_WORKERS", min(2 * multiprocessing.cpu_count() + 1, 4)))
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+
+keepalive = 5
+timeout = 60
+graceful_timeout = 30
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info").lower()
+
+
+def post_fork(server, worker):
+    """Torna o psycopg2 cooperativo com o gevent em cada worker"""
+    from psycogreen.gevent import patch_psycopg
+
+    patch_psycopg()
@@ -2,10 +2,13 @@
 Unit tests for Weather API endpoints with security testing
 """
 import pytest
+import base64
 import json
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
 from flask import Flask
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
 # Import the weather API module
 import sys
@@ -16,11 +19,18 @@ from app.api.weather_api import (
     weather_bp,
     validate_limit_param,
     validate_hours_param,
+    clamped_int_param,
     validate_date_param,
+    parse_date_param,
+    monitoring_schedule,
     sanitize_string_param,
     rate_limiter,
     check_rate_limit
 )
+from app.services.aeris_weather_service import AerisWeatherService
+from app.services.alert_service import AlertService
+from app.services.database_service import DatabaseService
+from app.utils.json_provider import OrjsonProvider
 
 
 class TestInputValidation:
@@ -60,6 +70,13 @@ class TestInputValidation:
         assert validate_date_param('2024-01-01') == '2024-01-01'
         assert validate_date_param('2025-12-31') == '2025-12-31'
 
+    def test_clamped_int_param(self):
+        """Test integer query parameters are clamped or fall back to the default"""
+        app = Flask(__name__)
+        for query, expected in (('', 7), ('days=3', 3), ('days=99', 16), ('days=0', 1), ('days=abc', 7)):
+            with app.test_request_context(f'/?{query}'):
+                assert clamped_int_param('days', default=7, min_val=1, max_val=16) == expected
+
     def test_validate_date_param_invalid(self):
         """Test invalid date parameter validation"""
         with pytest.raises(ValueError):
@@ -71,6 +88,23 @@ class TestInputValidation:
         with pytest.raises(ValueError):
             validate_date_param('2024-13-01')
 
+    def test_parse_date_param(self):
+        """Test strict YYYY-MM-DD parsing to a date"""
+        assert parse_date_param('2024-02-29') == datetime(2024, 2, 29).date()
+
+        for value in ('2024-1-5', '20240105', '2024-02-30', '', None):
+            with pytest.raises(ValueError):
+                parse_date_param(value)
+
+    def test_monitoring_schedule(self):
+        """Test next monitoring day is today or the following Mon/Wed/Fri"""
+        thursday = datetime(2025, 1, 2).date()
+        assert monitoring_schedule(thursday)[2:] == (False, '2025-01-03')
+        saturday = datetime(2025, 1, 4).date()
+        assert monitoring_schedule(saturday)[2:] == (False, '2025-01-06')
+        monday = datetime(2025, 1, 6).date()
+        assert monitoring_schedule(monday)[2:] == (True, '2025-01-06')
+
     def test_sanitize_string_param_valid(self):
         """Test valid string sanitization"""
         assert sanitize_string_param('hello_world') == 'hello_world'
@@ -111,6 +145,41 @@ class TestRateLimiting:
         # Next request should be blocked
         assert rate_limiter.is_allowed('192.168.1.1') is False
 
+    def test_rate_limiter_refills_over_time(self, monkeypatch):
+        """Test the bucket refills at max_requests per window"""
+        rate_limiter.requests.clear()
+        clock = [1000.0]
+        monkeypatch.setattr('app.api.weather_api.time.monotonic', lambda: clock[0])
+
+        for i in range(rate_limiter.max_requests):
+            assert rate_limiter.is_allowed('192.168.1.1') is True
+        assert rate_limiter.is_allowed('192.168.1.1') is False
+
+        # One request's worth of tokens comes back after window / max_requests seconds
+        clock[0] += rate_limiter.window_seconds / rate_limiter.max_requests
+        assert rate_limiter.is_allowed('192.168.1.1') is True
+        assert rate_limiter.is_allowed('192.168.1.1') is False
+
+    def test_rate_limiter_concurrent_clients(self):
+        """Test concurrent requests never exceed the bucket"""
+        rate_limiter.requests.clear()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: rate_limiter.is_allowed('192.168.1.9'),
+                                        range(rate_limiter.max_requests * 2)))
+
+        assert sum(results) == rate_limiter.max_requests
+
+    def test_rate_limiter_evicts_least_recent_clients(self, monkeypatch):
+        """Test the per-client table stays bounded"""
+        rate_limiter.requests.clear()
+        monkeypatch.setattr(rate_limiter, 'max_clients', 3)
+
+        for ip in ('10.0.0.1', '10.0.0.2', '10.0.0.3', '10.0.0.1', '10.0.0.4'):
+            rate_limiter.is_allowed(ip)
+
+        assert list(rate_limiter.requests) == ['10.0.0.3', '10.0.0.1', '10.0.0.4']
+
     def test_rate_limiter_different_ips(self):
         """Test that different IPs are tracked separately"""
         rate_limiter.requests.clear()
@@ -158,12 +227,30 @@ class TestWeatherAPIEndpoints:
         assert data['status'] == 'healthy'
         assert data['database'] == 'connected'
         assert 'timestamp' in data
+        assert response.cache_control.no_store is True
 
         # Check security headers
         assert response.headers['X-Frame-Options'] == 'DENY'
         assert response.headers['X-Content-Type-Options'] == 'nosniff'
         assert 'Content-Security-Policy' in response.headers
 
+    def test_health_endpoint_reuses_probe(self, client, app):
+        """Test repeated health checks share one database ping"""
+        rate_limiter.requests.clear()
+        app.config['db_service'].health_check.return_value = True
+
+        first = json.loads(client.get('/api/v1/weather/health').data)
+        second = json.loads(client.get('/api/v1/weather/health').data)
+
+        assert app.config['db_service'].health_check.call_count == 1
+        assert first['checked_at'] == second['checked_at']
+        assert first['checked_at'].endswith('Z')
+        assert datetime.fromisoformat(second['timestamp'].replace('Z', '+00:00')).tzinfo is not None
+
+    def test_blueprint_uses_orjson_provider(self, app):
+        """Test registering the blueprint switches JSON encoding to orjson"""
+        assert isinstance(app.json, OrjsonProvider)
+
     def test_health_endpoint_db_error(self, client, app):
         """Test health endpoint when database is down"""
         app.config['db_service'].health_check.return_value = False
@@ -175,6 +262,18 @@ class TestWeatherAPIEndpoints:
         assert data['status'] == 'unhealthy'
         assert data['database'] == 'disconnected'
 
+    def test_health_endpoint_probe_exception(self, client, app):
+        """Test health endpoint does not leak the exception text"""
+        app.config['db_service'].health_check.side_effect = Exception('password authentication failed for user "weather"')
+
+        response = client.get('/api/v1/weather/health')
+        assert response.status_code == 503
+
+        data = json.loads(response.data)
+        assert data['error'] == 'Health check failed'
+        assert 'details' not in data
+        assert b'password' not in response.data
+
     def test_latest_weather_endpoint(self, client, app):
         """Test latest weather endpoint"""
         # Mock database response
@@ -202,14 +301,30 @@ class TestWeatherAPIEndpoints:
         response = client.get('/api/v1/weather/latest?limit=abc')
         assert response.status_code == 200  # Should use default limit
 
+    def test_latest_weather_endpoint_null_feels_like(self, client, app):
+        """Test latest weather with a driver row whose feels_like is NULL"""
+        row = (1, 'Montreal', 20.46, None, 65, None, 3.21, None,
+               'Clouds', 'overcast clouds', '04d', 1700000000, -18000, datetime(2024, 1, 1))
+        conn = MagicMock()
+        conn.execute.return_value = [row]
+        db_service = DatabaseService('postgresql://test')
+        db_service.get_connection = MagicMock()
+        db_service.get_connection.return_value.__enter__.return_value = conn
+        app.config['db_service'] = db_service
+
+        response = client.get('/api/v1/weather/latest')
+        assert response.status_code == 200
+
+        record = json.loads(response.data)['data'][0]
+        assert record['feels_like'] is None
+        assert record['temperature'] == 20.5
+
     def test_current_weather_endpoint(self, client, app):
         """Test current weather endpoint"""
         # Mock database response
-        mock_weather_data = Mock()
         mock_latest = Mock()
         mock_latest.to_dict.return_value = {'temperature': 20.5}
-        mock_weather_data.get_latest.return_value = mock_latest
-        app.config['db_service'].get_weather_data.return_value = mock_weather_data
+        app.config['db_service'].get_latest_weather.return_value = mock_latest
 
         response = client.get('/api/v1/weather/current')
         assert response.status_code == 200
@@ -218,11 +333,27 @@ class TestWeatherAPIEndpoints:
         assert data['success'] is True
         assert 'data' in data
 
+    def test_current_weather_endpoint_null_feels_like(self, client, app):
+        """Test current weather with a LIMIT 1 driver row whose feels_like is NULL"""
+        row = (1, 'Montreal', 20.46, None, 65, None, 3.21, None,
+               'Clouds', 'overcast clouds', '04d', 1700000000, -18000, datetime(2024, 1, 1))
+        conn = MagicMock()
+        conn.execute.return_value.fetchone.return_value = row
+        db_service = DatabaseService('postgresql://test')
+        db_service.get_connection = MagicMock()
+        db_service.get_connection.return_value.__enter__.return_value = conn
+        app.config['db_service'] = db_service
+
+        response = client.get('/api/v1/weather/current')
+        assert response.status_code == 200
+
+        data = json.loads(response.data)['data']
+        assert data['feels_like'] is None
+        assert data['wind_speed'] == 3.2
+
     def test_current_weather_endpoint_no_data(self, client, app):
         """Test current weather endpoint when no data available"""
-        mock_weather_data = Mock()
-        mock_weather_data.get_latest.return_value = None
-        app.config['db_service'].get_weather_data.return_value = mock_weather_data
+        app.config['db_service'].get_latest_weather.return_value = None
 
         response = client.get('/api/v1/weather/current')
         assert response.status_code == 404
@@ -231,6 +362,55 @@ class TestWeatherAPIEndpoints:
         assert data['success'] is False
         assert 'No weather data available' in data['error']
 
+    def test_latest_weather_ndjson_stream(self, client, app):
+        """Test latest weather streamed as newline-delimited JSON"""
+        rate_limiter.requests.clear()
+        rows = [Mock(to_dict=Mock(return_value={'id': i, 'temperature': 20.5})) for i in range(3)]
+        app.config['db_service'].iter_weather_data.return_value = iter(rows)
+
+        response = client.get('/api/v1/weather/latest.ndjson?limit=3')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+
+        lines = response.get_data(as_text=True).splitlines()
+        assert [json.loads(line)['id'] for line in lines] == [0, 1, 2]
+        app.config['db_service'].iter_weather_data.assert_called_once_with(limit=3)
+
+    def test_latest_weather_endpoint_cached(self, client, app):
+        """Test repeated requests are served from the response cache"""
+        rate_limiter.requests.clear()
+        mock_weather_data = Mock()
+        mock_weather_data.data = [{'id': 1, 'temperature': 20.5}]
+        mock_weather_data.to_dict_list.return_value = [{'id': 1, 'temperature': 20.5}]
+        app.config['db_service'].get_weather_data.return_value = mock_weather_data
+
+        first = client.get('/api/v1/weather/latest?limit=5')
+        second = client.get('/api/v1/weather/latest?limit=5')
+        client.get('/api/v1/weather/latest?limit=6')
+
+        assert first.data == second.data
+        assert second.headers['X-Frame-Options'] == 'DENY'
+        assert app.config['db_service'].get_weather_data.call_count == 2
+
+        # Revalidation of the cached entry returns 304 without a body
+        assert second.headers['ETag'] == first.headers['ETag']
+        assert second.cache_control.max_age == 30
+        revalidated = client.get('/api/v1/weather/latest?limit=5', headers={'If-None-Match': first.headers['ETag']})
+        assert revalidated.status_code == 304
+        assert revalidated.data == b''
+
+    def test_current_weather_errors_not_cached(self, client, app):
+        """Test failed responses are not cached"""
+        rate_limiter.requests.clear()
+        app.config['db_service'].get_latest_weather.side_effect = [Exception('db down'), Mock(**{
+            'to_dict.return_value': {'temperature': 20.5}
+        })]
+
+        response = client.get('/api/v1/weather/current')
+        assert response.status_code == 500
+        assert 'details' not in json.loads(response.data)  # Exception text only in debug mode
+        assert client.get('/api/v1/weather/current').status_code == 200
+
     def test_chart_data_endpoint(self, client, app):
         """Test chart data endpoint"""
         mock_weather_data = Mock()
@@ -245,6 +425,33 @@ class TestWeatherAPIEndpoints:
         data = json.loads(response.data)
         assert data['success'] is True
         assert data['hours'] == 24
+        app.config['db_service'].get_weather_data.assert_called_once_with(limit=24)
+
+    def test_chart_data_endpoint_etag(self, client, app):
+        """Test chart data answers 304 for a matching weak ETag"""
+        rate_limiter.requests.clear()
+        mock_weather_data = Mock()
+        mock_weather_data.get_temperature_trend.return_value = [
+            {'timestamp': 1704067200, 'temperature': 20.5}
+        ]
+        app.config['db_service'].get_weather_data.return_value = mock_weather_data
+
+        response = client.get('/api/v1/weather/chart-data?hours=12')
+        assert response.headers['ETag'] == 'W/"1704067200-1"'
+        assert response.headers['Cache-Control'] == 'max-age=10'
+
+        # Served from the response cache, still revalidated
+        response = client.get('/api/v1/weather/chart-data?hours=12', headers={'If-None-Match': 'W/"1704067200-1"'})
+        assert response.status_code == 304
+
+        # Cache miss on a new key: the view itself skips the body
+        response = client.get('/api/v1/weather/chart-data?hours=6', headers={'If-None-Match': 'W/"1704067200-1"'})
+        assert response.status_code == 304
+        assert response.data == b''
+
+        # ETag as rewritten by Flask-Compress for a gzip response
+        response = client.get('/api/v1/weather/chart-data?hours=6', headers={'If-None-Match': 'W/"1704067200-1:gzip"'})
+        assert response.status_code == 304
 
     def test_chart_data_endpoint_invalid_hours(self, client, app):
         """Test chart data endpoint with invalid hours"""
@@ -257,6 +464,257 @@ class TestWeatherAPIEndpoints:
         response = client.get('/api/v1/weather/chart-data?hours=abc')
         assert response.status_code == 200  # Should use default
 
+    def test_openmeteo_monitoring_summary(self, client, app):
+        """Test monitoring summary is computed from the fetched rows"""
+        rate_limiter.requests.clear()
+        app.config['open_meteo_service'].get_weekly_monitoring_data.return_value = pd.DataFrame({
+            'date': pd.to_datetime(['2024-01-01', '2024-01-03', '2024-01-05']),
+            'temperature_mean': [-5.0, 0.0, 5.0],
+            'temperature_max': [-1.0, 3.0, 9.0],
+            'temperature_min': [-9.0, -4.0, 1.0],
+            'precipitation': [0.0, 2.5, 1.5]
+        })
+
+        response = client.get('/api/v1/weather/openmeteo/monitoring?weeks=1')
+        assert response.status_code == 200
+
+        summary = json.loads(response.data)['summary']
+        assert summary['total_records'] == 3
+        assert summary['temperature'] == {'max': 9.0, 'min': -9.0, 'mean': 0.0, 'std': 5.0}
+        assert summary['precipitation']['total'] == 4.0
+        assert summary['precipitation']['days_with_rain'] == 2
+
+    def test_openmeteo_monitoring_records(self, client, app):
+        """Test DataFrame rows are embedded as records with ISO dates"""
+        rate_limiter.requests.clear()
+        app.config['open_meteo_service'].get_weekly_monitoring_data.return_value = pd.DataFrame({
+            'date': pd.to_datetime(['2024-01-01', '2024-01-03']),
+            'temperature_mean': [-5.0, float('nan')],
+            'precipitation': [0.0, 2.5]
+        })
+
+        response = client.get('/api/v1/weather/openmeteo/monitoring?weeks=1')
+        assert response.status_code == 200
+
+        data = json.loads(response.data)
+        assert data['total_records'] == 2
+        assert data['data'] == [
+            {'date': '2024-01-01T00:00:00', 'temperature_mean': -5.0, 'precipitation': 0.0},
+            {'date': '2024-01-03T00:00:00', 'temperature_mean': None, 'precipitation': 2.5}
+        ]
+
+    def test_openmeteo_historical_etag(self, client, app):
+        """Test historical data is revalidated with ETag / If-None-Match"""
+        rate_limiter.requests.clear()
+        app.config['open_meteo_service'].get_historical_weather.return_value = pd.DataFrame({
+            'date': ['2024-01-01', '2024-01-02'],
+            'temperature_mean': [-5.0, -3.5]
+        })
+        url = '/api/v1/weather/openmeteo/historical?start_date=2024-01-01&end_date=2024-01-02'
+
+        response = client.get(url)
+        assert response.status_code == 200
+        etag = response.headers['ETag']
+
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+        assert response.headers['X-Content-Type-Options'] == 'nosniff'
+
+    def test_openmeteo_historical_cache_ttl(self, client, app, monkeypatch):
+        """Test only fully past ranges stay in the server cache for a day"""
+        rate_limiter.requests.clear()
+        clock = [1000.0]
+        monkeypatch.setattr('app.utils.cache.time.monotonic', lambda: clock[0])
+        service = app.config['open_meteo_service']
+        service.get_historical_weather.return_value = pd.DataFrame({
+            'date': ['2024-01-01'],
+            'temperature_mean': [-5.0]
+        })
+        week_ago = (date.today() - timedelta(days=7)).isoformat()
+        past_url = '/api/v1/weather/openmeteo/historical?start_date=2024-01-01&end_date=2024-01-02'
+        open_url = f'/api/v1/weather/openmeteo/historical?start_date={week_ago}&end_date={date.today()}'
+
+        client.get(past_url)
+        client.get(open_url)
+        assert service.get_historical_weather.call_count == 2
+
+        clock[0] += 120
+        client.get(past_url)
+        client.get(open_url)
+        assert service.get_historical_weather.call_count == 3
+
+    def test_upstream_route_error_hides_details(self, client, app):
+        """Test upstream exception text (URLs, keys) only reaches clients in debug mode"""
+        rate_limiter.requests.clear()
+        app.config['open_meteo_service'].get_current_weather.side_effect = Exception(
+            'HTTPSConnectionPool: /v1/forecast?apikey=secret')
+
+        response = client.get('/api/v1/weather/openmeteo/current')
+        assert response.status_code == 500
+        data = json.loads(response.data)
+        assert data['error'] == 'Failed to fetch Open-Meteo current weather'
+        assert b'secret' not in response.data
+
+        app.debug = True
+        response = client.get('/api/v1/weather/openmeteo/current')
+        assert 'apikey=secret' in json.loads(response.data)['details']
+
+    def test_aeris_locations_deduplicated(self, client, app):
+        """Test repeated locations and fields are fetched once, in order"""
+        rate_limiter.requests.clear()
+        service = app.config['aeris_weather_service']
+        service.locations_loop.return_value = pd.DataFrame({'place.name': ['montreal', 'toronto']})
+
+        response = client.get('/api/v1/weather/aeris/locations'
+                              '?locations=montreal,ca&locations=toronto,ca&locations=montreal,ca'
+                              '&fields=periods.tempC&fields=periods.tempC')
+        assert response.status_code == 200
+        service.locations_loop.assert_called_once_with(['montreal,ca', 'toronto,ca'], ['periods.tempC'])
+
+    def test_aeris_historical_range_too_large(self, client, app):
+        """Test oversize Aeris ranges are rejected before any upstream call"""
+        rate_limiter.requests.clear()
+
+        response = client.get('/api/v1/weather/aeris/historical?start_date=2024-01-01&end_date=2024-03-31')
+        assert response.status_code == 413
+        assert json.loads(response.data)['success'] is False
+        app.config['aeris_weather_service'].get_historical_weather_range.assert_not_called()
+
+    def test_aeris_historical_date_etag(self, client, app):
+        """Test past-day Aeris data is publicly cacheable and revalidated with ETag"""
+        rate_limiter.requests.clear()
+        app.config['aeris_weather_service'].get_historical_weather_date.return_value = pd.DataFrame({
+            'place.name': ['montreal'],
+            'periods.tempC': [-4.5]
+        })
+        url = '/api/v1/weather/aeris/historical/2024-01-01'
+
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.cache_control.public is True
+        assert response.cache_control.max_age == 24 * 3600
+        etag = response.headers['ETag']
+
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+
+    def test_openmeteo_historical_csv_streams_windows(self, client, app):
+        """Test historical CSV is streamed one window at a time"""
+        rate_limiter.requests.clear()
+        service = app.config['open_meteo_service']
+        service.get_historical_weather.side_effect = lambda start, end: pd.DataFrame({
+            'date': pd.date_range(start, end),
+            'temperature_mean': 1.0
+        })
+
+        response = client.get('/api/v1/weather/openmeteo/historical/csv?start_date=2023-01-01&end_date=2024-01-10')
+        assert response.status_code == 200
+        assert response.mimetype == 'text/csv'
+
+        lines = response.get_data(as_text=True).splitlines()
+        assert lines[0] == 'date,temperature_mean'
+        assert len(lines) == 1 + 375
+        assert service.get_historical_weather.call_count == 2
+
+    def test_openmeteo_historical_csv_range_limit(self, client, app):
+        """Test historical CSV rejects ranges over 10 years"""
+        rate_limiter.requests.clear()
+
+        response = client.get('/api/v1/weather/openmeteo/historical/csv?start_date=2000-01-01&end_date=2024-01-01')
+        assert response.status_code == 400
+        app.config['open_meteo_service'].get_historical_weather.assert_not_called()
+
+    def test_openmeteo_batch_endpoint(self, client, app):
+        """Test batch endpoint runs each sub-request against the service"""
+        rate_limiter.requests.clear()
+        app.config['open_meteo_service'].get_current_weather.return_value = {'temperature': 20.5}
+        app.config['open_meteo_service'].get_forecast_weather.return_value = [{'date': '2024-01-01'}]
+
+        response = client.post('/api/v1/weather/openmeteo/batch', json={
+            'requests': [{'op': 'current'}, {'op': 'forecast', 'days': 3}]
+        })
+        assert response.status_code == 200
+
+        data = json.loads(response.data)
+        assert data['success'] is True
+        assert [r['op'] for r in data['results']] == ['current', 'forecast']
+        assert data['results'][0]['body']['data'] == {'temperature': 20.5}
+        app.config['open_meteo_service'].get_forecast_weather.assert_called_once_with(3)
+
+    def test_openmeteo_forecast_cached(self, client, app):
+        """Test upstream-bound routes reuse the response for identical parameters"""
+        rate_limiter.requests.clear()
+        service = app.config['open_meteo_service']
+        service.get_forecast_weather.return_value = [{'date': '2024-01-01'}]
+        service.get_current_weather.return_value = {'temperature': 20.5}
+
+        assert client.get('/api/v1/weather/openmeteo/forecast?days=3').status_code == 200
+        assert client.get('/api/v1/weather/openmeteo/forecast?days=3').status_code == 200
+        service.get_forecast_weather.assert_called_once_with(3)
+
+    def test_openmeteo_batch_endpoint_invalid_op(self, client, app):
+        """Test batch endpoint rejects unknown operations"""
+        rate_limiter.requests.clear()
+
+        response = client.post('/api/v1/weather/openmeteo/batch', json={'requests': [{'op': 'drop'}]})
+        assert response.status_code == 400
+
+        data = json.loads(response.data)
+        assert data['success'] is False
+        assert 'current' in data['available_ops']
+
+        # Unhashable ops are a client error, not a 500
+        response = client.post('/api/v1/weather/openmeteo/batch', json={'requests': [{'op': ['current']}]})
+        assert response.status_code == 400
+
+    def test_openmeteo_batch_rate_limited_per_op(self, client, app):
+        """Test every batch op is counted against the rate limiter"""
+        rate_limiter.requests.clear()
+        app.config['open_meteo_service'].get_current_weather.return_value = {'temperature': 20.5}
+        batch = {'requests': [{'op': 'current'}] * 10}
+
+        for _ in range(10):
+            assert client.post('/api/v1/weather/openmeteo/batch', json=batch).status_code == 200
+        assert client.post('/api/v1/weather/openmeteo/batch', json=batch).status_code == 429
+        assert app.config['open_meteo_service'].get_current_weather.call_count == 100
+
+    def test_openmeteo_batch_historical_params(self, client, app):
+        """Test batch historical op validates its own dates"""
+        rate_limiter.requests.clear()
+        service = app.config['open_meteo_service']
+        service.get_historical_weather.return_value = pd.DataFrame({
+            'date': ['2024-01-01'],
+            'temperature_mean': [-5.0]
+        })
+
+        response = client.post('/api/v1/weather/openmeteo/batch', json={'requests': [
+            {'op': 'historical', 'start_date': '2024-01-01', 'end_date': '2024-01-02'},
+            {'op': 'historical', 'start_date': 20240101, 'end_date': '2024-01-02'},
+        ]})
+        results = json.loads(response.data)['results']
+        assert [r['status'] for r in results] == [200, 400]
+        service.get_historical_weather.assert_called_once_with(date(2024, 1, 1), date(2024, 1, 2))
+
+    def test_basic_auth_required(self, client, app):
+        """Test admin endpoints accept only the configured credentials"""
+        rate_limiter.requests.clear()
+        app.config['ADMIN_USERNAME'] = 'ops'
+        app.config['ADMIN_PASSWORD'] = 's3cret'
+        url = '/api/v1/weather/monitoring/status'
+
+        def basic(credentials):
+            return {'Authorization': 'Basic ' + base64.b64encode(credentials).decode()}
+
+        assert client.get(url).status_code == 401
+        assert client.get(url, headers=basic(b'ops:wrong')).status_code == 401
+        assert client.get(url, headers=basic(b'admin:s3cret')).status_code == 401
+        assert client.get(url, headers={'Authorization': 'Basic not-base64!'}).status_code == 401
+        response = client.get(url, headers=basic(b'ops:s3cret'))
+        assert response.status_code == 200
+        assert response.cache_control.no_store is True
+
     def test_rate_limiting(self, client, app):
         """Test rate limiting"""
         rate_limiter.requests.clear()
@@ -282,7 +740,6 @@ class TestWeatherAPIEndpoints:
         mock_weather_data = Mock()
         mock_weather_data.data = [{'id': 1, 'temperature': 20.5}]
         mock_weather_data.to_dict_list.return_value = [{'id': 1, 'temperature': 20.5}]
-        mock_weather_data.get_latest.return_value = Mock(to_dict=lambda: {'temperature': 20.5})
 
         mock_stats = Mock()
         mock_stats.to_dict.return_value = {
@@ -294,6 +751,7 @@ class TestWeatherAPIEndpoints:
 
         app.config['db_service'].get_weather_data.return_value = mock_weather_data
         app.config['db_service'].get_weather_stats.return_value = mock_stats
+        app.config['db_service'].get_latest_weather.return_value = Mock(to_dict=lambda: {'temperature': 20.5})
 
         endpoints = [
             '/api/v1/weather/health',
@@ -330,5 +788,81 @@ class TestWeatherAPIEndpoints:
         # So security headers may not be present on 404 responses
 
 
+class TestAlertService:
+    """Test Telegram alert delivery"""
+
+    def test_send_alert_is_queued_and_delivered(self, monkeypatch):
+        """Test alerts are queued and posted by the background worker"""
+        monkeypatch.setenv('TELEGRAM_TOKEN', 'token')
+        monkeypatch.setenv('TELEGRAM_CHAT_ID', '42')
+        post = Mock(return_value=Mock(status_code=200))
+        monkeypatch.setattr(AlertService._session, 'post', post)
+
+        assert AlertService().send_alert('boom', 'ERROR') is True
+        AlertService._queue.join()
+
+        url = post.call_args[0][0]
+        assert url == 'https://api.telegram.org/bottoken/sendMessage'
+        assert post.call_args[1]['json']['chat_id'] == '42'
+
+    def test_legacy_send_alert_uses_shared_queue(self, monkeypatch):
+        """Test app.alerts.send_alert goes through AlertService's queue and worker"""
+        from app import alerts
+        monkeypatch.setattr(alerts, 'TELEGRAM_TOKEN', 'token')
+        monkeypatch.setattr(alerts, 'TELEGRAM_CHAT_ID', '42')
+        post = Mock(return_value=Mock(status_code=200))
+        monkeypatch.setattr(AlertService._session, 'post', post)
+
+        alerts.send_alert('boom')
+        AlertService._queue.join()
+
+        assert post.call_args[1]['json'] == {'chat_id': '42', 'text': 'boom'}
+
+    def test_send_error_alert_suppresses_repeats(self, monkeypatch):
+        """Test the same error is alerted once per window"""
+        service = AlertService()
+        send_alert = Mock(return_value=True)
+        monkeypatch.setattr(service, 'send_alert', send_alert)
+
+        service.send_error_alert('db down', 'repeat test')
+        service.send_error_alert('db down', 'repeat test')
+        service.send_error_alert('db timeout', 'repeat test')
+
+        assert send_alert.call_count == 2
+
+    def test_send_alert_disabled(self, monkeypatch):
+        """Test alerts are not queued without Telegram credentials"""
+        monkeypatch.delenv('TELEGRAM_TOKEN', raising=False)
+        monkeypatch.delenv('TELEGRAM_CHAT_ID', raising=False)
+
+        assert AlertService().send_alert('boom') is False
+        assert AlertService._queue.empty()
+
+
+
+class TestAerisWeatherService:
+    """Test AerisWeather fan-out"""
+
+    def test_historical_range_fetches_all_pairs(self, monkeypatch):
+        """Test every date and location is fetched and grouped per date"""
+        service = AerisWeatherService()
+        calls = []
+
+        def fetch(location, day, custom_fields=None):
+            calls.append((day.isoformat(), location))
+            if day.day == 2:
+                return None
+            return pd.DataFrame({'place.name': [location], 'day': [day.isoformat()]})
+
+        monkeypatch.setattr(service, 'aeris_api_dataframe_historical', fetch)
+
+        results = service.get_historical_weather_range(
+            datetime(2024, 1, 1).date(), datetime(2024, 1, 3).date(), ['montreal,ca', 'toronto,ca'])
+
+        assert len(calls) == 6
+        assert list(results) == ['2024-01-01', '2024-01-03']
+        assert results['2024-01-03']['place.name'].tolist() == ['montreal,ca', 'toronto,ca']
+
+
 if __name__ == '__main__':
     pytest.main([__file__])